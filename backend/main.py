@@ -6,6 +6,7 @@ Data cleaning, EDA, and report generation API
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from routers import upload, report, payment, auth, admin
+from services.pdf_generator import shutdown_pdf_workers
 import uvicorn
 
 app = FastAPI(
@@ -47,7 +48,7 @@ app.include_router(admin.router)
 
 
 def cleanup_old_files():
-    """Delete files in uploads directory older than 10 days"""
+    """Delete files in uploads directory (including subdirectories) older than 10 days"""
     import os
     import time
     
@@ -60,20 +61,30 @@ def cleanup_old_files():
     
     print("Running cleanup task for old files...")
     count = 0
-    for filename in os.listdir(upload_dir):
-        if filename == ".gitkeep":
-            continue
-            
-        file_path = os.path.join(upload_dir, filename)
-        try:
-            if os.path.isfile(file_path):
-                file_mtime = os.path.getmtime(file_path)
-                if file_mtime < ten_days_ago:
-                    os.remove(file_path)
-                    count += 1
-                    print(f"Deleted old file: {filename}")
-        except Exception as e:
-            print(f"Error deleting {filename}: {e}")
+    # Walk the whole tree bottom-up: stored files live in per-user/shard
+    # subdirectories, which are removed once emptied
+    for dir_path, _, filenames in os.walk(upload_dir, topdown=False):
+        for name in filenames:
+            if name == ".gitkeep":
+                continue
+                
+            file_path = os.path.join(dir_path, name)
+            filename = os.path.relpath(file_path, upload_dir)
+            try:
+                if os.path.isfile(file_path):
+                    file_mtime = os.path.getmtime(file_path)
+                    if file_mtime < ten_days_ago:
+                        os.remove(file_path)
+                        count += 1
+                        print(f"Deleted old file: {filename}")
+            except Exception as e:
+                print(f"Error deleting {filename}: {e}")
+        
+        if dir_path != upload_dir:
+            try:
+                os.rmdir(dir_path)  # only succeeds once the directory is empty
+            except OSError:
+                pass
             
     print(f"Cleanup complete. Removed {count} files.")
 
@@ -83,6 +94,11 @@ async def startup_event():
     cleanup_old_files()
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    shutdown_pdf_workers()
+
+
 @app.get("/")
 async def root():
     return {
@@ -10,7 +10,7 @@ from datetime import datetime
 
 from utils.db import get_database
 from services.export import ExportService
-from services.pdf_generator import PDFReportGenerator
+from services.pdf_generator import generate_report_async
 
 router = APIRouter(prefix="/report", tags=["Report"])
 
@@ -84,27 +84,20 @@ async def reanalyze_report(report_id: str, request: ReanalyzeRequest):
             {"$set": update_data}
         )
         
-        # Prepare Response
-        response_data = sanitize_for_json({
+        # Prepare Response - reuse the already sanitized fields instead of
+        # converting and walking the same results (and data head) again
+        response_data = {
             "success": True,
             "reportId": report_id,
-            "selectedFeatures": request.features,
-            "summary": results["summary"],
-            "correlation": results["correlation"],
-            "graphs": results["graphs"],
-            "cleanedDataHead": results["cleaned_df"].head(10000).to_dict(orient="records"),
-            "insights": results["insights"],
-            "cleaningLog": results["cleaning_log"],
-            "qualityScore": results["quality_score"],
-            "duplicates": results["duplicates_info"],
-            "recommendations": results["recommendations"],
-            # 🔥 NEW PILLARS - ADDING HERE FOR FRONTEND
-            "columnAnalysis": results["columnAnalysis"],
-            "healthScore": results["healthScore"],
-            "engineeringSuggestions": results["engineeringSuggestions"],
-            "mlReadiness": results["mlReadiness"],
-            "targetAnalysis": results["targetAnalysis"],
-        })
+            **{key: update_data[key] for key in (
+                "selectedFeatures", "summary", "correlation", "graphs",
+                "cleanedDataHead", "insights", "cleaningLog", "qualityScore",
+                "duplicates", "recommendations",
+                # 🔥 NEW PILLARS - ADDING HERE FOR FRONTEND
+                "columnAnalysis", "healthScore", "engineeringSuggestions",
+                "mlReadiness", "targetAnalysis",
+            )},
+        }
         
         print(f"📡 Sending {len(results.get('graphs', []))} graphs and new intelligence pillars to frontend")
         
@@ -158,8 +151,7 @@ async def download_pdf_report(report_id: str):
             raise HTTPException(status_code=404, detail="Report not found")
         
         # Generate PDF
-        pdf_gen = PDFReportGenerator()
-        pdf_buffer = pdf_gen.generate_report(
+        pdf_buffer = await generate_report_async(
             summary=report.get("summary", {}),
             correlation=report.get("correlation", {}),
             insights=report.get("insights", []),
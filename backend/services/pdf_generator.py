@@ -2,7 +2,12 @@
 PDF Report Generator - Generate professional PDF reports
 """
 
+import asyncio
 import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, List
 from datetime import datetime
 
@@ -18,6 +23,133 @@ except ImportError:
     HAS_REPORTLAB = False
 
 
+if HAS_REPORTLAB:
+    # Table styles are immutable once built, so every report shares them
+    _SUMMARY_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8b5cf6')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 11),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8fafc')),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f1f5f9')]),
+    ])
+
+    _QUALITY_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#22c55e')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
+    ])
+
+    _STATS_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#6366f1')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f1f5f9')]),
+    ])
+
+
+# Each spawned worker is a fresh interpreter that imports reportlab, and PDF
+# downloads are occasional, so a couple of workers per server process is enough
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", "2"))
+
+_EXECUTOR = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Create the PDF worker pool on first use (spawned, so server state is not forked)."""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ProcessPoolExecutor(
+            max_workers=PDF_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _EXECUTOR
+
+
+def shutdown_pdf_workers():
+    """
+    Stop the PDF worker pool if it was started.
+    Call this on application shutdown.
+    """
+    global _EXECUTOR
+    if _EXECUTOR is not None:
+        _EXECUTOR.shutdown(wait=True, cancel_futures=True)
+        _EXECUTOR = None
+
+
+def _render_report(kwargs: Dict[str, Any]) -> bytes:
+    """Worker entry point: build one report and return the raw PDF bytes."""
+    return PDFReportGenerator().generate_report(**kwargs).getvalue()
+
+
+@lru_cache(maxsize=None)
+def _build_styles():
+    """Build the report stylesheet once; styles are shared read-only by every report."""
+    styles = getSampleStyleSheet()
+    
+    styles.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        textColor=colors.HexColor('#8b5cf6'),
+    ))
+    
+    styles.add(ParagraphStyle(
+        name='CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=16,
+        spaceBefore=20,
+        spaceAfter=10,
+        textColor=colors.HexColor('#4f46e5'),
+    ))
+    
+    styles.add(ParagraphStyle(
+        name='CustomBody',
+        parent=styles['Normal'],
+        fontSize=11,
+        spaceAfter=8,
+    ))
+    
+    styles.add(ParagraphStyle(
+        name='Insight',
+        parent=styles['Normal'],
+        fontSize=10,
+        leftIndent=20,
+        borderColor=colors.HexColor('#8b5cf6'),
+        borderWidth=1,
+        borderPadding=5,
+        spaceAfter=5,
+    ))
+    
+    styles.add(ParagraphStyle(
+        name='Footer',
+        parent=styles['Normal'],
+        fontSize=9,
+        textColor=colors.gray,
+        alignment=TA_CENTER,
+    ))
+    
+    styles.add(ParagraphStyle(
+        name='FooterSmall',
+        parent=styles['Normal'],
+        fontSize=8,
+        textColor=colors.gray,
+        alignment=TA_CENTER,
+    ))
+    return styles
+
+
 class PDFReportGenerator:
     """Generate PDF reports from analysis data."""
 
@@ -25,46 +157,7 @@ class PDFReportGenerator:
         if not HAS_REPORTLAB:
             raise ImportError("reportlab is required for PDF generation. Install with: pip install reportlab")
         
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles."""
-        self.styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            textColor=colors.HexColor('#8b5cf6'),
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='CustomHeading',
-            parent=self.styles['Heading2'],
-            fontSize=16,
-            spaceBefore=20,
-            spaceAfter=10,
-            textColor=colors.HexColor('#4f46e5'),
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='CustomBody',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            spaceAfter=8,
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='Insight',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            leftIndent=20,
-            borderColor=colors.HexColor('#8b5cf6'),
-            borderWidth=1,
-            borderPadding=5,
-            spaceAfter=5,
-        ))
+        self.styles = _build_styles()
 
     def generate_report(
         self,
@@ -115,17 +208,7 @@ class PDFReportGenerator:
         ]
         
         summary_table = Table(summary_data, colWidths=[2.5*inch, 2*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8b5cf6')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8fafc')),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f1f5f9')]),
-        ]))
+        summary_table.setStyle(_SUMMARY_TABLE_STYLE)
         elements.append(summary_table)
         elements.append(Spacer(1, 20))
         
@@ -149,14 +232,7 @@ class PDFReportGenerator:
                     quality_data.append([key.capitalize(), f"{value:.0f}%"])
                 
                 quality_table = Table(quality_data, colWidths=[2*inch, 1.5*inch])
-                quality_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#22c55e')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 10),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
-                ]))
+                quality_table.setStyle(_QUALITY_TABLE_STYLE)
                 elements.append(quality_table)
             elements.append(Spacer(1, 20))
         
@@ -176,27 +252,14 @@ class PDFReportGenerator:
         if stats:
             elements.append(Paragraph("📊 Column Statistics", self.styles['CustomHeading']))
             
-            stats_data = [["Column", "Mean", "Std", "Min", "Max", "Median"]]
-            for col, col_stats in list(stats.items())[:10]:  # Limit columns
-                stats_data.append([
-                    col[:15],  # Truncate column name
-                    f"{col_stats.get('mean', 0):.2f}",
-                    f"{col_stats.get('std', 0):.2f}",
-                    f"{col_stats.get('min', 0):.2f}",
-                    f"{col_stats.get('max', 0):.2f}",
-                    f"{col_stats.get('median', 0):.2f}",
-                ])
+            stats_data = [["Column", "Mean", "Std", "Min", "Max", "Median"]] + [
+                [col[:15]]  # Truncate column name
+                + [f"{col_stats.get(key, 0):.2f}" for key in ('mean', 'std', 'min', 'max', 'median')]
+                for col, col_stats in list(stats.items())[:10]  # Limit columns
+            ]
             
             stats_table = Table(stats_data, colWidths=[1.2*inch, 0.8*inch, 0.8*inch, 0.8*inch, 0.8*inch, 0.8*inch])
-            stats_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#6366f1')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f1f5f9')]),
-            ]))
+            stats_table.setStyle(_STATS_TABLE_STYLE)
             elements.append(stats_table)
             elements.append(Spacer(1, 20))
         
@@ -204,26 +267,24 @@ class PDFReportGenerator:
         elements.append(Spacer(1, 30))
         elements.append(Paragraph(
             "Generated by Kuya Cloud - Your AI Data Analysis Assistant",
-            ParagraphStyle(
-                name='Footer',
-                parent=self.styles['Normal'],
-                fontSize=9,
-                textColor=colors.gray,
-                alignment=TA_CENTER,
-            )
+            self.styles['Footer']
         ))
         elements.append(Paragraph(
             f"© {datetime.now().year} Kuya Data",
-            ParagraphStyle(
-                name='FooterSmall',
-                parent=self.styles['Normal'],
-                fontSize=8,
-                textColor=colors.gray,
-                alignment=TA_CENTER,
-            )
+            self.styles['FooterSmall']
         ))
         
         # Build PDF
         doc.build(elements)
         buffer.seek(0)
         return buffer
+
+
+async def generate_report_async(**kwargs) -> io.BytesIO:
+    """Generate a PDF report in a worker process without blocking the event loop.
+
+    Takes the same keyword arguments as PDFReportGenerator.generate_report().
+    """
+    loop = asyncio.get_running_loop()
+    pdf_bytes = await loop.run_in_executor(_get_executor(), _render_report, kwargs)
+    return io.BytesIO(pdf_bytes)
@@ -0,0 +1,25 @@
+import pandas as pd
+
+from utils.intelligence import DataQualityAnalyzer
+
+
+def test_leakage_matches_id_as_a_whole_token():
+    df = pd.DataFrame({
+        "id": [1, 2, 3],
+        "user_id": [4, 5, 6],
+        "userId": [7, 8, 9],
+        "valid": [True, False, True],
+        "paid": [1.0, 2.0, 3.0],
+        "guid": ["a", "b", "c"],
+    })
+    warnings = DataQualityAnalyzer(df).detect_leakage_basic()["warnings"]
+    risks = {w["column"]: w["risk"] for w in warnings}
+
+    assert risks == {"id": "high", "user_id": "high", "userId": "high"}
+
+
+def test_leakage_flags_timestamps_as_medium():
+    df = pd.DataFrame({"created_at": [1, 2], "city": ["a", "b"]})
+    warnings = DataQualityAnalyzer(df).detect_leakage_basic()["warnings"]
+
+    assert [(w["column"], w["risk"]) for w in warnings] == [("created_at", "medium")]
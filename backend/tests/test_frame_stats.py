@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+
+from utils.intelligence.frame_stats import FrameStats
+
+
+def _large_mixed_frame() -> pd.DataFrame:
+    n = 100_002
+    # 0 / "0" and 1 / "1" hash the same but are distinct values
+    mixed = np.array([0, "0", 1, "1"] + list(range(2, n - 2)), dtype=object)
+    return pd.DataFrame({"mixed": mixed, "flag": np.zeros(n, dtype=np.int64)})
+
+
+def test_duplicate_count_large_frame_ignores_hash_collisions():
+    df = _large_mixed_frame()
+
+    assert df.duplicated().sum() == 0
+    assert FrameStats(df).duplicate_count == 0
+
+
+def test_duplicate_count_large_frame_matches_exact_count():
+    df = _large_mixed_frame()
+    df = pd.concat([df, df.iloc[[0, 1, 5, 5]]], ignore_index=True)
+
+    assert FrameStats(df).duplicate_count == df.duplicated().sum() == 4
@@ -0,0 +1,91 @@
+import asyncio
+import os
+import threading
+
+from utils import storage
+from utils.storage import StorageService
+
+
+def _write_behind_service(base_path, name, size):
+    """Add a file the usage cache doesn't know about."""
+    with open(os.path.join(base_path, name), "wb") as f:
+        f.write(b"x" * size)
+
+
+def test_usage_is_cached_within_ttl_and_tracks_saves(tmp_path):
+    async def run():
+        service = StorageService(str(tmp_path))
+        await service.save_file(b"a" * 10, "a.csv", "u1")
+        assert await service.get_storage_usage() == 10
+        assert await service.get_storage_usage("u1") == 10
+
+        # Cached: changes made behind the service's back are not seen...
+        _write_behind_service(tmp_path, "stray.bin", 100)
+        assert await service.get_storage_usage() == 10
+
+        # ...while saves and deletes keep the cached totals current
+        path = await service.save_file(b"b" * 5, "b.csv", "u1")
+        assert await service.get_storage_usage() == 15
+        assert await service.get_storage_usage("u1") == 15
+        await service.delete_file(path)
+        assert await service.get_storage_usage("u1") == 10
+
+    asyncio.run(run())
+
+
+def test_usage_rewalks_after_ttl(tmp_path, monkeypatch):
+    async def run():
+        service = StorageService(str(tmp_path))
+        await service.save_file(b"a" * 10, "a.csv")
+        assert await service.get_storage_usage() == 10
+
+        _write_behind_service(tmp_path, "stray.bin", 100)
+        monkeypatch.setattr(storage, "USAGE_CACHE_TTL", 0)
+        assert await service.get_storage_usage() == 110
+
+    asyncio.run(run())
+
+
+def test_usage_walk_overlapping_a_save_is_not_cached(tmp_path, monkeypatch):
+    entered, release = threading.Event(), threading.Event()
+    scan_dir = storage._scan_dir
+
+    def blocking_scan_dir(path):
+        entered.set()
+        release.wait(5)
+        return scan_dir(path)
+
+    async def run():
+        service = StorageService(str(tmp_path))
+        await service.save_file(b"a" * 10, "a.csv")
+
+        monkeypatch.setattr(storage, "_scan_dir", blocking_scan_dir)
+        walk = asyncio.ensure_future(service.get_storage_usage())
+        while not entered.is_set():
+            await asyncio.sleep(0.01)
+        await service.save_file(b"b" * 7, "b.csv")  # lands mid-walk
+        release.set()
+        assert await walk == 17
+        monkeypatch.setattr(storage, "_scan_dir", scan_dir)
+
+        # Had the overlapped walk been cached, this stray file would go unseen
+        _write_behind_service(tmp_path, "stray.bin", 100)
+        assert await service.get_storage_usage() == 117
+        # A walk nothing overlapped is cached again
+        _write_behind_service(tmp_path, "stray2.bin", 1000)
+        assert await service.get_storage_usage() == 117
+
+    asyncio.run(run())
+
+
+def test_sync_usage_shares_the_cache(tmp_path):
+    async def save(service):
+        await service.save_file(b"a" * 10, "a.csv", "u1")
+
+    service = StorageService(str(tmp_path))
+    asyncio.run(save(service))
+    assert service.get_storage_usage_sync("u1") == 10
+
+    _write_behind_service(tmp_path, "stray.bin", 100)
+    assert asyncio.run(service.get_storage_usage("u1")) == 10
+    assert service.get_storage_usage_sync() == 110
@@ -4,4 +4,4 @@ Utils package
 
 from .db import get_database, get_sync_database, init_database, close_database
 from .pdf_generator import PDFReportGenerator
-from .storage import StorageService, storage
+from .storage import StorageService, get_storage
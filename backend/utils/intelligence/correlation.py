@@ -0,0 +1,35 @@
+"""
+Correlation Helpers - shared numeric kernels
+============================================
+Purpose:
+    Compute the numeric correlation matrix used by several analyzers.
+    Kept separate so every module agrees on one implementation.
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Optional
+
+
+def abs_correlation(num_df: pd.DataFrame, values: Optional[np.ndarray] = None,
+                    has_missing: Optional[bool] = None) -> np.ndarray:
+    """
+    Absolute Pearson correlation matrix of a numeric block.
+    
+    Uses BLAS-backed np.corrcoef on the raw ndarray. Falls back to pandas'
+    pairwise-complete corr() only when the block has missing values, so
+    NaN handling matches pandas exactly. Pass `values` when the float64
+    block of `num_df` is already materialized, and `has_missing` when null
+    counts are already known, to skip the NaN scan.
+    """
+    if values is None:
+        values = num_df.to_numpy(dtype=np.float64, na_value=np.nan)
+    if has_missing is None:
+        has_missing = bool(np.isnan(values).any())
+    if has_missing:
+        corr = num_df.corr().to_numpy()
+    else:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.atleast_2d(np.corrcoef(values, rowvar=False))
+    # In place: keep a single (k, k) matrix alive instead of two
+    return np.abs(corr, out=corr)
@@ -16,25 +16,42 @@ Target Users:
     Everyone (free tier and above)
 """
 
-import pandas as pd
+import re
 import numpy as np
-from typing import Dict, List, Any
+import pandas as pd
+from functools import cached_property
+from typing import Dict, List, Any, Optional
+
+from .frame_stats import FrameStats
+
+
+# Identifier/timestamp keywords, matched as whole tokens of a snake_cased name
+# so 'user_id' and 'createdAt' hit but 'paid' or 'valid' do not.
+_CAMEL_RE = re.compile(r'(?<=[a-z0-9])(?=[A-Z])')
+_ID_RE = re.compile(r'(?<![a-z])(?:id|index|key|timestamp|created|updated)(?![a-z])')
+_HIGH_RE = re.compile(r'(?<![a-z])id(?![a-z])')
 
 
 class DataQualityAnalyzer:
     """Basic data quality analysis (FREE tier)."""
     
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, stats: Optional[FrameStats] = None):
         self.df = df
-        self.numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-        self.categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
+        self._stats = stats or FrameStats(df)
+        self.numeric_cols = self._stats.numeric_cols
+        self.categorical_cols = self._stats.categorical_cols
+    
+    @cached_property
+    def _cat_nun(self) -> pd.Series:
+        """Unique value count per categorical column."""
+        return self._stats.nunique[self.categorical_cols]
     
     def why_this_matters_basic(self) -> List[Dict[str, str]]:
         """Basic 1-line explanations for key findings."""
         insights = []
         
         # Missing values insight
-        missing_pct = (self.df.isnull().sum().sum() / self.df.size) * 100
+        missing_pct = self._stats.missing_pct
         if missing_pct > 0:
             insights.append({
                 "finding": "Missing Values Detected",
@@ -44,18 +61,17 @@ class DataQualityAnalyzer:
         
         # High cardinality
         for col in self.categorical_cols:
-            unique_ratio = self.df[col].nunique() / len(self.df)
+            unique_ratio = self._cat_nun[col] / len(self.df)
             if unique_ratio > 0.5:
                 insights.append({
                     "finding": f"High Cardinality: {col}",
-                    "why": f"Column '{col}' has {self.df[col].nunique()} unique values. One-hot encoding will explode dimensions.",
+                    "why": f"Column '{col}' has {self._cat_nun[col]} unique values. One-hot encoding will explode dimensions.",
                     "action": "Use target encoding or frequency encoding instead."
                 })
                 break  # Only show one in free tier
         
         # Skewed distribution
-        for col in self.numeric_cols[:3]:
-            skewness = self.df[col].skew()
+        for col, skewness in self._stats.numeric_df.iloc[:, :3].skew().items():
             if abs(skewness) > 2:
                 insights.append({
                     "finding": f"Skewed Distribution: {col}",
@@ -71,27 +87,27 @@ class DataQualityAnalyzer:
         warnings_list = []
         
         # Check for ID-like columns
-        for col in self.df.columns:
-            col_lower = col.lower()
-            if any(x in col_lower for x in ['id', 'index', 'key', 'timestamp', 'created', 'updated']):
-                warnings_list.append({
-                    "column": col,
-                    "risk": "high" if 'id' in col_lower else "medium",
-                    "warning": f"'{col}' looks like an identifier/timestamp. Including it may cause data leakage."
-                })
+        names = self.df.columns.astype(str).str.replace(_CAMEL_RE, '_', regex=True).str.lower()
+        hits = names.str.contains(_ID_RE)
+        high = names.str.contains(_HIGH_RE)
+        for col, is_high in zip(self.df.columns[hits], high[hits]):
+            warnings_list.append({
+                "column": col,
+                "risk": "high" if is_high else "medium",
+                "warning": f"'{col}' looks like an identifier/timestamp. Including it may cause data leakage."
+            })
         
         # Check for near-perfect correlations
         if len(self.numeric_cols) >= 2:
-            corr_matrix = self.df[self.numeric_cols].corr()
-            for i, col1 in enumerate(self.numeric_cols):
-                for col2 in self.numeric_cols[i+1:]:
-                    corr = abs(corr_matrix.loc[col1, col2])
-                    if corr > 0.95:
-                        warnings_list.append({
-                            "column": f"{col1} ↔ {col2}",
-                            "risk": "high",
-                            "warning": f"Very high correlation ({corr:.2f}). One might be derived from target."
-                        })
+            iu, ju, pair_corr = self._stats.abs_corr_pairs
+            mask = pair_corr > 0.95
+            for i, j, corr in zip(iu[mask], ju[mask], pair_corr[mask]):
+                col1, col2 = self.numeric_cols[i], self.numeric_cols[j]
+                warnings_list.append({
+                    "column": f"{col1} ↔ {col2}",
+                    "risk": "high",
+                    "warning": f"Very high correlation ({corr:.2f}). One might be derived from target."
+                })
         
         return {
             "has_leakage_risk": len(warnings_list) > 0,
@@ -102,47 +118,45 @@ class DataQualityAnalyzer:
         """Detect class imbalance in potential target columns."""
         imbalance_info = {}
         
-        for col in self.categorical_cols:
-            if self.df[col].nunique() <= 10:
-                value_counts = self.df[col].value_counts(normalize=True)
-                if len(value_counts) >= 2:
-                    ratio = value_counts.iloc[0] / value_counts.iloc[-1]
-                    if ratio > 3:
-                        imbalance_info[col] = {
-                            "is_imbalanced": True,
-                            "ratio": f"{ratio:.1f}:1",
-                            "majority_class": value_counts.index[0],
-                            "minority_class": value_counts.index[-1],
-                            "warning": "High imbalance! Accuracy will be misleading. Use F1-score or AUROC."
-                        }
-                    else:
-                        imbalance_info[col] = {
-                            "is_imbalanced": False,
-                            "ratio": f"{ratio:.1f}:1"
-                        }
+        for col, ratio in self._stats.imbalance_ratios.items():
+            if ratio > 3:
+                value_counts = self._stats.low_card_value_counts[col]
+                imbalance_info[col] = {
+                    "is_imbalanced": True,
+                    "ratio": f"{ratio:.1f}:1",
+                    "majority_class": value_counts.index[0],
+                    "minority_class": value_counts.index[-1],
+                    "warning": "High imbalance! Accuracy will be misleading. Use F1-score or AUROC."
+                }
+            else:
+                imbalance_info[col] = {
+                    "is_imbalanced": False,
+                    "ratio": f"{ratio:.1f}:1"
+                }
         
         return imbalance_info
     
     def outlier_presence_flag(self) -> Dict[str, Any]:
         """Simple yes/no outlier flag."""
-        outlier_cols = []
-        
-        for col in self.numeric_cols:
-            Q1 = self.df[col].quantile(0.25)
-            Q3 = self.df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            outliers = ((self.df[col] < Q1 - 1.5 * IQR) | (self.df[col] > Q3 + 1.5 * IQR)).sum()
-            if outliers > 0:
-                outlier_cols.append({
-                    "column": col,
-                    "count": int(outliers),
-                    "percentage": round(outliers / len(self.df) * 100, 1)
-                })
+        counts = self._stats.outlier_counts
+        affected = np.flatnonzero(counts > 0)
+        
+        # Only the first five are reported, so only those get a dict
+        shown = affected[:5]
+        percentages = np.round(counts[shown] / len(self.df) * 100, 1)
+        details = [
+            {
+                "column": self.numeric_cols[i],
+                "count": int(counts[i]),
+                "percentage": pct
+            }
+            for i, pct in zip(shown, percentages.tolist())
+        ]
         
         return {
-            "has_outliers": len(outlier_cols) > 0,
-            "total_columns_affected": len(outlier_cols),
-            "details": outlier_cols[:5]
+            "has_outliers": len(affected) > 0,
+            "total_columns_affected": len(affected),
+            "details": details
         }
     
     def executive_summary_basic(self) -> List[str]:
@@ -151,7 +165,7 @@ class DataQualityAnalyzer:
         
         summary.append(f"📊 Dataset has {len(self.df):,} rows and {len(self.df.columns)} columns.")
         
-        completeness = (1 - self.df.isnull().sum().sum() / self.df.size) * 100
+        completeness = (1 - self._stats.total_null / self.df.size) * 100
         if completeness >= 95:
             summary.append(f"✅ Data is {completeness:.1f}% complete - ready for analysis.")
         else:
@@ -166,10 +180,4 @@ class DataQualityAnalyzer:
     
     def has_significant_outliers(self) -> bool:
         """Helper to check for significant outliers."""
-        for col in self.numeric_cols[:5]:
-            Q1, Q3 = self.df[col].quantile([0.25, 0.75])
-            IQR = Q3 - Q1
-            outlier_pct = ((self.df[col] < Q1 - 1.5 * IQR) | (self.df[col] > Q3 + 1.5 * IQR)).sum() / len(self.df)
-            if outlier_pct > 0.05:
-                return True
-        return False
+        return bool((self._stats.outlier_counts[:5] / len(self.df) > 0.05).any())
@@ -0,0 +1,189 @@
+"""
+Frame Stats - shared whole-frame statistics
+===========================================
+Purpose:
+    Hold frame-wide reductions that several analyzers need.
+    One instance is shared per analysis so each full-frame scan runs once.
+"""
+
+import warnings
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+from .correlation import abs_correlation
+
+
+class FrameStats:
+    """Lazily computed, shared statistics for one DataFrame."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+
+    @cached_property
+    def numeric_cols(self) -> list:
+        """Names of the numeric columns, in frame order."""
+        return self.df.select_dtypes(include=[np.number]).columns.tolist()
+
+    @cached_property
+    def categorical_cols(self) -> list:
+        """Names of the object/category columns, in frame order."""
+        return self.df.select_dtypes(include=['object', 'category']).columns.tolist()
+
+    @cached_property
+    def numeric_df(self) -> pd.DataFrame:
+        """Numeric column block, sliced out of the frame once."""
+        return self.df[self.numeric_cols]
+
+    @cached_property
+    def numeric_values(self) -> np.ndarray:
+        """Numeric block as one float64 ndarray (rows x numeric cols), NaN for missing."""
+        # Kept at float64: quantile selection dominates these scans, so float32
+        # saves little, and it shifts IQR fences/skew on large-magnitude columns.
+        return self.numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    @cached_property
+    def numeric_mean(self) -> np.ndarray:
+        """Mean per numeric column, skipping NaN like pandas."""
+        with warnings.catch_warnings():
+            # All-NaN columns yield NaN, as in pandas
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return np.nanmean(self.numeric_values, axis=0)
+
+    @cached_property
+    def numeric_std(self) -> np.ndarray:
+        """Sample std (ddof=1) per numeric column, skipping NaN like pandas."""
+        with warnings.catch_warnings():
+            # Columns with fewer than two values yield NaN, as in pandas
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return np.nanstd(self.numeric_values, axis=0, ddof=1)
+
+    @cached_property
+    def numeric_skew(self) -> np.ndarray:
+        """Skewness per numeric column; same adjusted estimator and edge cases as DataFrame.skew()."""
+        values = self.numeric_values
+        mask = np.isnan(values)
+        count = (~mask).sum(axis=0).astype(np.float64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(mask, 0, values).sum(axis=0) / count
+            adjusted = np.where(mask, 0, values - mean)
+            adjusted2 = adjusted ** 2
+            m2 = adjusted2.sum(axis=0)
+            m3 = (adjusted2 * adjusted).sum(axis=0)
+            # Treat float noise as zero, as pandas does
+            m2 = np.where(np.abs(m2) < 1e-14, 0, m2)
+            m3 = np.where(np.abs(m3) < 1e-14, 0, m3)
+            result = (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2 ** 1.5)
+        result = np.where(m2 == 0, 0, result)
+        result[count < 3] = np.nan
+        return result
+
+    @cached_property
+    def numeric_quartiles(self) -> np.ndarray:
+        """Q1 and Q3 per numeric column as a (2, k) array; NaN-skipping like pandas."""
+        values = self.numeric_values
+        if values.size == 0:
+            return np.full((2, values.shape[1]), np.nan)
+        with warnings.catch_warnings():
+            # All-NaN columns yield NaN quartiles (and zero outliers), as in pandas
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return np.nanquantile(values, [0.25, 0.75], axis=0)
+
+    @cached_property
+    def outlier_counts(self) -> np.ndarray:
+        """IQR (1.5x) outlier count per numeric column, in one NumPy pass."""
+        values = self.numeric_values
+        q1, q3 = self.numeric_quartiles
+        iqr = q3 - q1
+        return ((values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)).sum(axis=0)
+
+    @cached_property
+    def abs_corr(self) -> np.ndarray:
+        """Absolute correlation matrix of the numeric block (numeric cols x numeric cols)."""
+        return abs_correlation(
+            self.numeric_df, self.numeric_values,
+            has_missing=bool(self.null_counts[self.numeric_cols].any()),
+        )
+
+    @cached_property
+    def abs_corr_pairs(self) -> tuple:
+        """Upper-triangle column pairs (i, j) with their absolute correlation, in column order."""
+        iu, ju = np.triu_indices(len(self.numeric_cols), k=1)
+        return iu, ju, self.abs_corr[iu, ju]
+
+    @cached_property
+    def null_mask(self) -> np.ndarray:
+        """Boolean missing-value mask (rows x cols); every null stat derives from it."""
+        return self.df.isnull().to_numpy()
+
+    @cached_property
+    def null_counts(self) -> pd.Series:
+        """Missing value count per column."""
+        return pd.Series(self.null_mask.sum(axis=0), index=self.df.columns)
+
+    @cached_property
+    def object_value_counts(self) -> dict:
+        """Unsorted value_counts() per object column.
+
+        One hash pass over the strings serves both the unique counts and the
+        class-balance checks, instead of nunique() and value_counts() each
+        hashing the column again.
+        """
+        return {col: ser.value_counts(sort=False) for col, ser in self.df.items() if ser.dtype == object}
+
+    @cached_property
+    def nunique(self) -> pd.Series:
+        """Unique value count per column."""
+        counts = [
+            len(self.object_value_counts[col]) if ser.dtype == object else ser.nunique()
+            for col, ser in self.df.items()
+        ]
+        return pd.Series(counts, index=self.df.columns, dtype=np.int64)
+
+    @cached_property
+    def total_null(self):
+        """Total missing cells in the frame."""
+        return self.null_counts.sum()
+
+    @cached_property
+    def missing_pct(self) -> float:
+        """Percentage of missing cells in the frame."""
+        return (self.total_null / self.df.size) * 100
+
+    @cached_property
+    def rows_with_any_null(self):
+        """Number of rows with at least one missing value."""
+        return self.null_mask.any(axis=1).sum()
+
+    @cached_property
+    def duplicate_count(self):
+        """Number of fully duplicated rows."""
+        if len(self.df) <= 100_000:
+            return self.df.duplicated().sum()
+        # Large frames: one 64-bit hash per row finds the candidate rows cheaply.
+        # Equal hashes don't imply equal rows (object columns hash via str, so
+        # 0 and "0" collide), so only those candidates get the exact check.
+        row_hashes = pd.util.hash_pandas_object(self.df, index=False)
+        candidates = row_hashes.duplicated(keep=False).to_numpy()
+        return self.df[candidates].duplicated().sum()
+
+    @cached_property
+    def low_card_value_counts(self) -> dict:
+        """value_counts() of each categorical column with at most 10 categories."""
+        # Same ordering as value_counts(), which sorts the unsorted counts this way
+        return {
+            col: (self.object_value_counts[col].sort_values(ascending=False)
+                  if col in self.object_value_counts else self.df[col].value_counts())
+            for col in self.categorical_cols
+            if self.nunique[col] <= 10
+        }
+
+    @cached_property
+    def imbalance_ratios(self) -> dict:
+        """Majority/minority class ratio of each low-cardinality categorical with two or more classes."""
+        return {
+            col: value_counts.iloc[0] / value_counts.iloc[-1]
+            for col, value_counts in self.low_card_value_counts.items()
+            if len(value_counts) >= 2
+        }
@@ -16,6 +16,7 @@ import pandas as pd
 from typing import Dict, Any
 
 from .data_quality import DataQualityAnalyzer
+from .frame_stats import FrameStats
 from .model_advice import ModelAdvisor
 from .production_checks import ProductionChecker
 
@@ -34,6 +35,54 @@ TIER_MAP = {
 }
 
 
+# Output key -> (analyzer attribute, method) per tier, indexed by tier level.
+# Each tier adds features, never removes: a tier runs its own row and all below.
+TIER_FEATURES = [
+    # ============ FREE TIER: Basic data quality insights ============
+    [
+        ("why_this_matters", "quality", "why_this_matters_basic"),
+        ("data_leakage_basic", "quality", "detect_leakage_basic"),
+        ("class_imbalance", "quality", "detect_class_imbalance"),
+        ("outlier_flag", "quality", "outlier_presence_flag"),
+        ("executive_summary", "quality", "executive_summary_basic"),
+    ],
+    # ============ STARTER TIER: Learning-focused features ============
+    [
+        ("confidence_scores", "advisor", "confidence_scores"),
+        ("tradeoff_analysis", "advisor", "tradeoff_analysis_light"),
+        ("baseline_model", "advisor", "suggest_baseline_model"),
+        ("metric_sensitivity", "advisor", "metric_sensitivity_basic"),
+        ("assumption_checker", "advisor", "assumption_checker_basic"),
+        ("outlier_strategy", "advisor", "outlier_strategy_suggestion"),
+        ("high_impact_features", "advisor", "high_impact_features"),
+    ],
+    # ============ PRO TIER: Professional ML features ============
+    [
+        # Model advice (Pro)
+        ("model_impact_confidence", "advisor", "model_impact_confidence"),
+        ("model_preprocessing_advice", "advisor", "model_specific_preprocessing"),
+        ("scaling_impact", "advisor", "scaling_impact_per_model"),
+        ("encoding_recommendation", "advisor", "encoding_choice_recommendation"),
+        ("feature_importance_preview", "advisor", "feature_importance_heuristic"),
+        ("feature_interactions", "advisor", "feature_interaction_hints"),
+        # Production checks (Pro)
+        ("train_serve_consistency", "production", "train_serve_consistency_check"),
+        ("preprocessing_pipeline", "production", "exportable_preprocessing_pipeline"),
+        ("saved_artifacts_info", "production", "saved_artifacts_info"),
+        ("reproducibility_lock", "production", "reproducibility_lock"),
+        ("risky_features", "production", "risky_features_flag"),
+    ],
+    # ============ ENTERPRISE TIER: Full production features ============
+    [
+        ("deployment_readiness", "production", "deployment_readiness_score"),
+        ("drift_risk", "production", "data_drift_risk"),
+        ("schema_alerts", "production", "schema_change_alerts"),
+        ("versioned_pipeline", "production", "versioned_pipeline_export"),
+        ("inference_cost", "production", "inference_cost_estimation"),
+    ],
+]
+
+
 class DataIntelligence:
     """
     Advanced data intelligence engine with tier-based features.
@@ -43,17 +92,27 @@ class DataIntelligence:
     - starter: Learning features
     - pro: Professional ML features
     - enterprise: Full production features
+    
+    With auto_categorize=True, object columns are analyzed as pandas 'category'
+    dtype (on a copy), so nunique/value_counts run on integer codes instead of
+    hashing Python strings.
     """
     
-    def __init__(self, df: pd.DataFrame, tier: str = "free"):
+    def __init__(self, df: pd.DataFrame, tier: str = "free", auto_categorize: bool = False):
+        if auto_categorize:
+            object_cols = df.select_dtypes(include=['object']).columns
+            if len(object_cols):
+                df = df.copy()
+                df[object_cols] = df[object_cols].astype('category')
         self.df = df
         self.tier = tier
         self.tier_level = TIER_MAP.get(tier.lower(), TIER_FREE)
         
         # Initialize analyzers
-        self.quality = DataQualityAnalyzer(df)
-        self.advisor = ModelAdvisor(df, self.quality.has_significant_outliers)
-        self.production = ProductionChecker(df)
+        stats = FrameStats(df)
+        self.quality = DataQualityAnalyzer(df, stats)
+        self.advisor = ModelAdvisor(df, self.quality.has_significant_outliers, stats)
+        self.production = ProductionChecker(df, stats)
     
     def analyze(self) -> Dict[str, Any]:
         """
@@ -61,71 +120,21 @@ class DataIntelligence:
         Pure orchestration - no logic here.
         """
         result = {}
-        
-        # ============ FREE TIER ============
-        if self.tier_level >= TIER_FREE:
-            result.update(self._run_free_tier())
-        
-        # ============ STARTER TIER ============
-        if self.tier_level >= TIER_STARTER:
-            result.update(self._run_starter_tier())
-        
-        # ============ PRO TIER ============
-        if self.tier_level >= TIER_PRO:
-            result.update(self._run_pro_tier())
-        
-        # ============ ENTERPRISE TIER ============
-        if self.tier_level >= TIER_ENTERPRISE:
-            result.update(self._run_enterprise_tier())
-        
+        for features in TIER_FEATURES[:self.tier_level + 1]:
+            for key, analyzer, method in features:
+                result[key] = getattr(getattr(self, analyzer), method)()
         return result
+
+
+def analyze_with_intelligence(df: pd.DataFrame, tier: str = "free") -> Dict[str, Any]:
+    """
+    Main entry point for intelligence analysis.
     
-    def _run_free_tier(self) -> Dict[str, Any]:
-        """Free tier: Basic data quality insights."""
-        return {
-            "why_this_matters": self.quality.why_this_matters_basic(),
-            "data_leakage_basic": self.quality.detect_leakage_basic(),
-            "class_imbalance": self.quality.detect_class_imbalance(),
-            "outlier_flag": self.quality.outlier_presence_flag(),
-            "executive_summary": self.quality.executive_summary_basic(),
-        }
-    
-    def _run_starter_tier(self) -> Dict[str, Any]:
-        """Starter tier: Learning-focused features."""
-        return {
-            "confidence_scores": self.advisor.confidence_scores(),
-            "tradeoff_analysis": self.advisor.tradeoff_analysis_light(),
-            "baseline_model": self.advisor.suggest_baseline_model(),
-            "metric_sensitivity": self.advisor.metric_sensitivity_basic(),
-            "assumption_checker": self.advisor.assumption_checker_basic(),
-            "outlier_strategy": self.advisor.outlier_strategy_suggestion(),
-            "high_impact_features": self.advisor.high_impact_features(),
-        }
-    
-    def _run_pro_tier(self) -> Dict[str, Any]:
-        """Pro tier: Professional ML features."""
-        return {
-            # Model advice (Pro)
-            "model_impact_confidence": self.advisor.model_impact_confidence(),
-            "model_preprocessing_advice": self.advisor.model_specific_preprocessing(),
-            "scaling_impact": self.advisor.scaling_impact_per_model(),
-            "encoding_recommendation": self.advisor.encoding_choice_recommendation(),
-            "feature_importance_preview": self.advisor.feature_importance_heuristic(),
-            "feature_interactions": self.advisor.feature_interaction_hints(),
-            # Production checks (Pro)
-            "train_serve_consistency": self.production.train_serve_consistency_check(),
-            "preprocessing_pipeline": self.production.exportable_preprocessing_pipeline(),
-            "saved_artifacts_info": self.production.saved_artifacts_info(),
-            "reproducibility_lock": self.production.reproducibility_lock(),
-            "risky_features": self.production.risky_features_flag(),
-        }
+    Args:
+        df: Pandas DataFrame to analyze
+        tier: User tier (free, starter, pro, enterprise)
     
-    def _run_enterprise_tier(self) -> Dict[str, Any]:
-        """Enterprise tier: Full production features."""
-        return {
-            "deployment_readiness": self.production.deployment_readiness_score(),
-            "drift_risk": self.production.data_drift_risk(),
-            "schema_alerts": self.production.schema_change_alerts(),
-            "versioned_pipeline": self.production.versioned_pipeline_export(),
-            "inference_cost": self.production.inference_cost_estimation(),
-        }
+    Returns:
+        Dictionary with all applicable intelligence features
+    """
+    return DataIntelligence(df, tier).analyze()
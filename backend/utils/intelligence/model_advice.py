@@ -29,26 +29,35 @@ Target Users:
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any
+from functools import cached_property
+from typing import Dict, List, Any, Optional
+
+from .frame_stats import FrameStats
 
 
 class ModelAdvisor:
     """Model recommendations and preprocessing advice."""
     
-    def __init__(self, df: pd.DataFrame, has_significant_outliers_fn):
+    def __init__(self, df: pd.DataFrame, has_significant_outliers_fn, stats: Optional[FrameStats] = None):
         self.df = df
-        self.numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-        self.categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
+        self._stats = stats or FrameStats(df)
+        self.numeric_cols = self._stats.numeric_cols
+        self.categorical_cols = self._stats.categorical_cols
         self._has_significant_outliers = has_significant_outliers_fn
     
+    @cached_property
+    def _has_outliers(self) -> bool:
+        """Outlier probe result, asked once and shared by every method."""
+        return bool(self._has_significant_outliers())
+    
     # ==================== STARTER TIER ====================
     
     def confidence_scores(self) -> Dict[str, Any]:
         """Confidence score for data reliability (Starter tier)."""
         scores = {}
         
-        completeness = (1 - self.df.isnull().sum().sum() / self.df.size) * 100
-        consistency = 100 - (self.df.duplicated().sum() / len(self.df) * 100)
+        completeness = (1 - self._stats.total_null / self.df.size) * 100
+        consistency = 100 - (self._stats.duplicate_count / len(self.df) * 100)
         scores["data_reliability"] = {
             "score": round((completeness + consistency) / 2, 1),
             "explanation": "How reliable is this dataset? Based on completeness and consistency.",
@@ -77,7 +86,7 @@ class ModelAdvisor:
         feature_score = 60
         if len(self.numeric_cols) >= 5:
             feature_score += 15
-        if not self._has_significant_outliers():
+        if not self._has_outliers:
             feature_score += 10
         if len(self.categorical_cols) <= 5:
             feature_score += 10
@@ -107,14 +116,14 @@ class ModelAdvisor:
         """Light trade-off analysis between options."""
         tradeoffs = []
         
-        missing_pct = (self.df.isnull().sum().sum() / self.df.size) * 100
+        missing_pct = self._stats.missing_pct
         if missing_pct > 0:
             tradeoffs.append({
                 "decision": "Missing Value Handling",
                 "option_a": {
                     "name": "Drop rows with missing values",
                     "pros": ["Simple", "No bias introduced"],
-                    "cons": [f"Lose {self.df.isnull().any(axis=1).sum()} rows ({self.df.isnull().any(axis=1).sum()/len(self.df)*100:.1f}%)"]
+                    "cons": [f"Lose {self._stats.rows_with_any_null} rows ({self._stats.rows_with_any_null/len(self.df)*100:.1f}%)"]
                 },
                 "option_b": {
                     "name": "Impute with median/mode",
@@ -137,7 +146,7 @@ class ModelAdvisor:
                     "pros": ["Robust to outliers", "Better for skewed data"],
                     "cons": ["Less common", "May not suit all models"]
                 },
-                "recommendation": "option_b" if self._has_significant_outliers() else "option_a"
+                "recommendation": "option_b" if self._has_outliers else "option_a"
             })
         
         return tradeoffs
@@ -149,15 +158,10 @@ class ModelAdvisor:
         n_samples = len(self.df)
         n_features = len(self.df.columns)
         has_categorical = len(self.categorical_cols) > 0
-        has_missing = self.df.isnull().sum().sum() > 0
+        has_missing = self._stats.total_null > 0
         
-        task_type = "classification"
-        for col in self.categorical_cols:
-            if self.df[col].nunique() <= 10:
-                task_type = "classification"
-                break
-        else:
-            task_type = "regression"
+        has_low_card_categorical = (self._stats.nunique[self.categorical_cols] <= 10).any()
+        task_type = "classification" if has_low_card_categorical else "regression"
         
         if task_type == "classification":
             if n_samples < 1000:
@@ -206,13 +210,7 @@ class ModelAdvisor:
         """Basic metric sensitivity analysis."""
         sensitivity = {}
         
-        is_imbalanced = False
-        for col in self.categorical_cols:
-            if self.df[col].nunique() <= 10:
-                value_counts = self.df[col].value_counts(normalize=True)
-                if len(value_counts) >= 2 and value_counts.iloc[0] / value_counts.iloc[-1] > 3:
-                    is_imbalanced = True
-                    break
+        is_imbalanced = any(ratio > 3 for ratio in self._stats.imbalance_ratios.values())
         
         sensitivity["accuracy"] = {
             "reliability": "low" if is_imbalanced else "high",
@@ -247,21 +245,19 @@ class ModelAdvisor:
         }
         
         if len(self.numeric_cols) >= 2:
-            correlations = self.df[self.numeric_cols].corr().abs()
-            avg_corr = correlations.values[np.triu_indices_from(correlations.values, 1)].mean()
+            iu, ju, pair_corr = self._stats.abs_corr_pairs
+            avg_corr = pair_corr.mean()
             checks["linearity"] = {
                 "status": "pass" if avg_corr > 0.3 else "warning",
                 "message": f"Average feature correlation: {avg_corr:.2f}",
                 "recommendation": "Linear models may work" if avg_corr > 0.3 else "Consider non-linear models"
             }
-        
-        if len(self.numeric_cols) >= 2:
-            corr_matrix = self.df[self.numeric_cols].corr().abs()
-            high_corr_pairs = []
-            for i in range(len(self.numeric_cols)):
-                for j in range(i+1, len(self.numeric_cols)):
-                    if corr_matrix.iloc[i, j] > 0.8:
-                        high_corr_pairs.append((self.numeric_cols[i], self.numeric_cols[j]))
+            
+            high_corr = pair_corr > 0.8
+            high_corr_pairs = [
+                (self.numeric_cols[i], self.numeric_cols[j])
+                for i, j in zip(iu[high_corr], ju[high_corr])
+            ]
             
             checks["multicollinearity"] = {
                 "status": "warning" if high_corr_pairs else "pass",
@@ -274,27 +270,18 @@ class ModelAdvisor:
     
     def outlier_strategy_suggestion(self) -> Dict[str, Any]:
         """Suggest outlier handling strategy."""
-        outlier_cols = []
-        for col in self.numeric_cols:
-            Q1 = self.df[col].quantile(0.25)
-            Q3 = self.df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            outliers = ((self.df[col] < Q1 - 1.5 * IQR) | (self.df[col] > Q3 + 1.5 * IQR)).sum()
-            if outliers > 0:
-                outlier_cols.append({
-                    "column": col,
-                    "count": int(outliers),
-                    "percentage": round(outliers / len(self.df) * 100, 1)
-                })
+        counts = self._stats.outlier_counts
+        counts = counts[counts > 0]
         
-        if not outlier_cols:
+        if not len(counts):
             return {
                 "strategy": "none",
                 "message": "No significant outliers detected",
                 "confidence": 90
             }
         
-        total_outlier_pct = sum(d["percentage"] for d in outlier_cols) / len(outlier_cols)
+        # Mean outlier percentage over every affected column
+        total_outlier_pct = (counts / len(self.df) * 100).mean()
         
         if total_outlier_pct < 1:
             return {
@@ -320,16 +307,20 @@ class ModelAdvisor:
     
     def high_impact_features(self) -> List[Dict[str, Any]]:
         """Identify top 3 high-impact features."""
-        impact_scores = {}
+        n = len(self.df)
         
-        for col in self.numeric_cols:
-            variance_score = min(self.df[col].std() / (self.df[col].mean() + 1e-10), 2) * 30
-            missing_penalty = (1 - self.df[col].isnull().sum() / len(self.df)) * 30
-            unique_score = min(self.df[col].nunique() / len(self.df) * 100, 40)
-            
-            impact_scores[col] = variance_score + missing_penalty + unique_score
+        variance_score = np.minimum(self._stats.numeric_std / (self._stats.numeric_mean + 1e-10), 2) * 30
+        missing_penalty = (1 - self._stats.null_counts[self.numeric_cols].to_numpy() / n) * 30
+        unique_score = np.minimum(self._stats.nunique[self.numeric_cols].to_numpy() / n * 100, 40)
+        impact_scores = variance_score + missing_penalty + unique_score
         
-        sorted_features = sorted(impact_scores.items(), key=lambda x: x[1], reverse=True)[:3]
+        candidates = range(len(impact_scores))
+        if len(impact_scores) > 3 and not np.isnan(impact_scores).any():
+            # Only the top 3 are reported: pre-select them (ties included) in O(k)
+            third = np.partition(impact_scores, -3)[-3]
+            candidates = np.flatnonzero(impact_scores >= third)
+        top = sorted(candidates, key=lambda i: impact_scores[i], reverse=True)[:3]
+        sorted_features = [(self.numeric_cols[i], impact_scores[i]) for i in top]
         
         return [
             {
@@ -382,6 +373,9 @@ class ModelAdvisor:
     
     def scaling_impact_per_model(self) -> Dict[str, Any]:
         """Explain scaling impact per model type."""
+        stds = self._stats.numeric_std
+        has_varied_scales = bool((stds > 10 * np.nanmean(stds)).any()) if self.numeric_cols else False
+        
         return {
             "high_impact": {
                 "models": ["Linear Regression", "Logistic Regression", "SVM", "Neural Networks", "KNN"],
@@ -394,8 +388,8 @@ class ModelAdvisor:
                 "recommendation": "Scaling optional but may help interpretability"
             },
             "your_data_recommendation": {
-                "has_varied_scales": any(self.df[col].std() > 10 * self.df[self.numeric_cols].std().mean() for col in self.numeric_cols) if self.numeric_cols else False,
-                "suggested_scaler": "RobustScaler" if self._has_significant_outliers() else "StandardScaler"
+                "has_varied_scales": has_varied_scales,
+                "suggested_scaler": "RobustScaler" if self._has_outliers else "StandardScaler"
             }
         }
     
@@ -403,8 +397,7 @@ class ModelAdvisor:
         """Recommend encoding strategies."""
         recommendations = {}
         
-        for col in self.categorical_cols:
-            cardinality = self.df[col].nunique()
+        for col, cardinality in self._stats.nunique[self.categorical_cols].items():
             
             if cardinality <= 2:
                 recommendations[col] = {
@@ -436,14 +429,22 @@ class ModelAdvisor:
     def feature_importance_heuristic(self) -> List[Dict[str, Any]]:
         """Heuristic feature importance without training."""
         importance = []
-        
-        for col in self.numeric_cols:
-            variance_score = min(self.df[col].std() / (self.df[self.numeric_cols].std().mean() + 1e-10), 2) / 2
-            missing_penalty = 1 - (self.df[col].isnull().sum() / len(self.df))
+        if not self.numeric_cols:
+            return importance
+        
+        stds = self._stats.numeric_std
+        variance_scores = np.minimum(stds / (np.nanmean(stds) + 1e-10), 2) / 2
+        missing_penalties = 1 - self._stats.null_counts[self.numeric_cols].to_numpy() / len(self.df)
+        if len(self.numeric_cols) > 1:
+            target_idx = int(np.nanargmax(stds))
+            target_corr = self._stats.abs_corr[:, target_idx]
+        
+        for i, col in enumerate(self.numeric_cols):
+            variance_score = variance_scores[i]
+            missing_penalty = missing_penalties[i]
             
             if len(self.numeric_cols) > 1:
-                target_proxy = self.df[self.numeric_cols].std().idxmax()
-                corr_score = abs(self.df[col].corr(self.df[target_proxy])) if col != target_proxy else 0
+                corr_score = target_corr[i] if i != target_idx else 0
             else:
                 corr_score = 0.5
             
@@ -467,19 +468,19 @@ class ModelAdvisor:
         interactions = []
         
         if len(self.numeric_cols) >= 2:
-            corr = self.df[self.numeric_cols].corr()
+            iu, ju, pair_corr = self._stats.abs_corr_pairs
+            # Only the first 5 moderate pairs are reported; skip building the rest
+            hits = np.flatnonzero((pair_corr > 0.3) & (pair_corr < 0.7))[:5]
             
-            for i, col1 in enumerate(self.numeric_cols):
-                for col2 in self.numeric_cols[i+1:]:
-                    corr_val = abs(corr.loc[col1, col2])
-                    
-                    if 0.3 < corr_val < 0.7:
-                        interactions.append({
-                            "features": [col1, col2],
-                            "correlation": round(corr_val, 2),
-                            "suggested_interaction": f"{col1}_x_{col2}",
-                            "code": f"df['{col1}_x_{col2}'] = df['{col1}'] * df['{col2}']",
-                            "reason": "Moderate correlation may indicate multiplicative relationship"
-                        })
-        
-        return interactions[:5]
+            for k in hits:
+                col1, col2 = self.numeric_cols[iu[k]], self.numeric_cols[ju[k]]
+                corr_val = pair_corr[k]
+                interactions.append({
+                    "features": [col1, col2],
+                    "correlation": round(corr_val, 2),
+                    "suggested_interaction": f"{col1}_x_{col2}",
+                    "code": f"df['{col1}_x_{col2}'] = df['{col1}'] * df['{col2}']",
+                    "reason": "Moderate correlation may indicate multiplicative relationship"
+                })
+        
+        return interactions
@@ -26,20 +26,136 @@ Target Users:
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any
+from functools import cached_property
+from typing import Dict, List, Any, Optional
 import hashlib
 from datetime import datetime
 
+from .frame_stats import FrameStats
+
+
+_PIPELINE_TEMPLATE = """from sklearn.pipeline import Pipeline
+from sklearn.compose import ColumnTransformer
+from sklearn.preprocessing import StandardScaler, OneHotEncoder
+from sklearn.impute import SimpleImputer
+
+numeric_transformer = Pipeline(steps=[
+    ('imputer', SimpleImputer(strategy='median')),
+    ('scaler', StandardScaler())
+])
+
+categorical_transformer = Pipeline(steps=[
+    ('imputer', SimpleImputer(strategy='most_frequent')),
+    ('encoder', OneHotEncoder(handle_unknown='ignore'))
+])
+
+preprocessor = ColumnTransformer(
+    transformers=[
+        ('num', numeric_transformer, {numeric}),
+        ('cat', categorical_transformer, {categorical})
+    ])"""
+
+_REPRODUCIBILITY_CODE = """
+# Add this at the start of your script
+import numpy as np
+import random
+import os
+
+SEED = 42
+np.random.seed(SEED)
+random.seed(SEED)
+os.environ['PYTHONHASHSEED'] = str(SEED)
+
+# For sklearn
+from sklearn.model_selection import train_test_split
+X_train, X_test = train_test_split(X, test_size=0.2, random_state=SEED)
+"""
+
+_SCHEMA_VALIDATION_CODE = """
+def validate_schema(new_df, expected_schema):
+    errors = []
+    for col in expected_schema['columns']:
+        if col not in new_df.columns:
+            errors.append(f"Missing column: {col}")
+    for col in new_df.columns:
+        if col not in expected_schema['columns']:
+            errors.append(f"Unexpected column: {col}")
+    return errors
+"""
+
+_VERSIONED_EXPORT_TEMPLATE = """
+import joblib
+from datetime import datetime
+
+# Save with version
+version = "{version}"
+artifacts = {{
+    'preprocessor': preprocessor,
+    'model': model,
+    'version': version,
+    'created_at': datetime.now().isoformat(),
+    'n_features': {n_features},
+    'feature_names': {feature_names}
+}}
+
+joblib.dump(artifacts, f'pipeline_v{{version}}.pkl')
+"""
+
 
 class ProductionChecker:
     """Production readiness and deployment checks."""
     
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, stats: Optional[FrameStats] = None):
         self.df = df
-        self.numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-        self.categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
+        self._stats = stats or FrameStats(df)
+        self._n = len(df)
+        self._cols = df.columns.tolist()
+        self._ncols = len(self._cols)
+        self.numeric_cols = self._stats.numeric_cols
+        self.categorical_cols = self._stats.categorical_cols
         self.datetime_cols = df.select_dtypes(include=['datetime64']).columns.tolist()
     
+    # ==================== CACHED STATS ====================
+    # Computed lazily (only Pro/Enterprise tiers touch them) and at most once.
+    
+    @cached_property
+    def _desc(self) -> pd.DataFrame:
+        """Per numeric column: mean, std, 25%, 75% from the shared frame stats."""
+        mean, std = self._stats.numeric_mean, self._stats.numeric_std
+        q1, q3 = self._stats.numeric_quartiles
+        return pd.DataFrame({'mean': mean, 'std': std, '25%': q1, '75%': q3}, index=self.numeric_cols)
+    
+    @cached_property
+    def _null(self) -> pd.Series:
+        """Missing value count per column."""
+        return self._stats.null_counts
+    
+    @cached_property
+    def _nun(self) -> pd.Series:
+        """Unique value count per column."""
+        return self._stats.nunique
+    
+    @cached_property
+    def _extreme_outlier_counts(self) -> np.ndarray:
+        """IQR (3x) outlier count per numeric column, in one NumPy pass."""
+        values = self._stats.numeric_values
+        q1 = self._desc['25%'].to_numpy(dtype=np.float64)
+        q3 = self._desc['75%'].to_numpy(dtype=np.float64)
+        iqr = q3 - q1
+        return ((values < q1 - 3 * iqr) | (values > q3 + 3 * iqr)).sum(axis=0)
+    
+    @cached_property
+    def _risk_stats(self) -> np.ndarray:
+        """Per numeric column: missing %, std, skew, extreme outlier % as one (k, 4) array."""
+        if not self.numeric_cols:
+            return np.empty((0, 4))
+        return np.column_stack([
+            self._null[self.numeric_cols].to_numpy(dtype=np.float64) / self._n * 100,
+            self._desc['std'].to_numpy(dtype=np.float64),
+            self._stats.numeric_skew,
+            self._extreme_outlier_counts / self._n * 100,
+        ])
+    
     # ==================== PRO TIER ====================
     
     def train_serve_consistency_check(self) -> Dict[str, Any]:
@@ -54,23 +170,25 @@ class ProductionChecker:
                 "recommendation": "Convert to numeric features (year, month, day) or relative values"
             })
         
+        # One lookup per column; ID-column issues still follow all cardinality ones
+        id_issues = []
         for col in self.categorical_cols:
-            if self.df[col].nunique() > 100:
+            nu = self._nun[col]
+            if nu > 100:
                 issues.append({
                     "type": "high_cardinality",
                     "column": col,
                     "warning": "New categories in production will fail",
                     "recommendation": "Use handle_unknown='ignore' in encoder"
                 })
-        
-        for col in self.categorical_cols:
-            if self.df[col].nunique() > len(self.df) * 0.5:
-                issues.append({
+            if nu > self._n * 0.5:
+                id_issues.append({
                     "type": "potential_id",
                     "column": col,
                     "warning": "Looks like an ID column - will not generalize",
                     "recommendation": "Exclude from features"
                 })
+        issues.extend(id_issues)
         
         return {
             "consistent": len(issues) == 0,
@@ -80,34 +198,8 @@ class ProductionChecker:
     
     def exportable_preprocessing_pipeline(self) -> Dict[str, Any]:
         """Generate sklearn-ready pipeline code."""
-        code_parts = []
-        
-        code_parts.append("from sklearn.pipeline import Pipeline")
-        code_parts.append("from sklearn.compose import ColumnTransformer")
-        code_parts.append("from sklearn.preprocessing import StandardScaler, OneHotEncoder")
-        code_parts.append("from sklearn.impute import SimpleImputer")
-        code_parts.append("")
-        
-        code_parts.append("numeric_transformer = Pipeline(steps=[")
-        code_parts.append("    ('imputer', SimpleImputer(strategy='median')),")
-        code_parts.append("    ('scaler', StandardScaler())")
-        code_parts.append("])")
-        code_parts.append("")
-        
-        code_parts.append("categorical_transformer = Pipeline(steps=[")
-        code_parts.append("    ('imputer', SimpleImputer(strategy='most_frequent')),")
-        code_parts.append("    ('encoder', OneHotEncoder(handle_unknown='ignore'))")
-        code_parts.append("])")
-        code_parts.append("")
-        
-        code_parts.append("preprocessor = ColumnTransformer(")
-        code_parts.append("    transformers=[")
-        code_parts.append(f"        ('num', numeric_transformer, {self.numeric_cols}),")
-        code_parts.append(f"        ('cat', categorical_transformer, {self.categorical_cols})")
-        code_parts.append("    ])")
-        
         return {
-            "code": "\n".join(code_parts),
+            "code": _PIPELINE_TEMPLATE.format(numeric=self.numeric_cols, categorical=self.categorical_cols),
             "description": "Ready-to-use sklearn preprocessing pipeline",
             "numeric_columns": self.numeric_cols,
             "categorical_columns": self.categorical_cols
@@ -128,16 +220,16 @@ class ProductionChecker:
                     "content": {
                         "numeric_features": self.numeric_cols,
                         "categorical_features": self.categorical_cols,
-                        "expected_columns": list(self.df.columns)
+                        "expected_columns": self._cols
                     }
                 },
                 {
                     "name": "data_stats.json",
                     "description": "Training data statistics for validation",
                     "content": {
-                        "n_samples": len(self.df),
-                        "n_features": len(self.df.columns),
-                        "numeric_means": self.df[self.numeric_cols].mean().to_dict() if self.numeric_cols else {}
+                        "n_samples": self._n,
+                        "n_features": self._ncols,
+                        "numeric_means": self._desc['mean'].to_dict()
                     }
                 }
             ],
@@ -149,53 +241,37 @@ class ProductionChecker:
     
     def reproducibility_lock(self) -> Dict[str, Any]:
         """Generate reproducibility information."""
-        data_string = self.df.to_string()
-        data_hash = hashlib.md5(data_string.encode()).hexdigest()[:12]
+        # Hash typed column values directly instead of stringifying every cell
+        h = hashlib.blake2b(digest_size=6)
+        h.update(pd.util.hash_pandas_object(self.df, index=True).to_numpy().tobytes())
+        h.update(str(self._cols).encode())
+        data_hash = h.hexdigest()
         
         return {
             "data_hash": data_hash,
             "random_seed": 42,
-            "python_code": """
-# Add this at the start of your script
-import numpy as np
-import random
-import os
-
-SEED = 42
-np.random.seed(SEED)
-random.seed(SEED)
-os.environ['PYTHONHASHSEED'] = str(SEED)
-
-# For sklearn
-from sklearn.model_selection import train_test_split
-X_train, X_test = train_test_split(X, test_size=0.2, random_state=SEED)
-""",
+            "python_code": _REPRODUCIBILITY_CODE,
             "data_version": data_hash,
-            "n_samples": len(self.df),
-            "n_features": len(self.df.columns)
+            "n_samples": self._n,
+            "n_features": self._ncols
         }
     
     def risky_features_flag(self) -> List[Dict[str, Any]]:
         """Identify risky/unstable features."""
         risky = []
         
-        for col in self.numeric_cols:
+        for col, (missing_pct, std, skew, outlier_pct) in zip(self.numeric_cols, self._risk_stats):
             issues = []
             
-            missing_pct = self.df[col].isnull().sum() / len(self.df) * 100
             if missing_pct > 20:
                 issues.append(f"High missing ({missing_pct:.1f}%)")
             
-            if self.df[col].std() < 0.01:
+            if std < 0.01:
                 issues.append("Near-zero variance")
             
-            skew = self.df[col].skew()
             if abs(skew) > 5:
                 issues.append(f"Extreme skewness ({skew:.1f})")
             
-            Q1, Q3 = self.df[col].quantile([0.25, 0.75])
-            IQR = Q3 - Q1
-            outlier_pct = ((self.df[col] < Q1 - 3*IQR) | (self.df[col] > Q3 + 3*IQR)).sum() / len(self.df) * 100
             if outlier_pct > 5:
                 issues.append(f"Many extreme outliers ({outlier_pct:.1f}%)")
             
@@ -216,20 +292,19 @@ X_train, X_test = train_test_split(X, test_size=0.2, random_state=SEED)
         score = 100
         issues = []
         
-        missing_pct = (self.df.isnull().sum().sum() / self.df.size) * 100
+        missing_pct = self._stats.missing_pct
         if missing_pct > 5:
             score -= 15
             issues.append("High missing values need handling")
         
-        for col in self.df.columns:
-            if self.df[col].nunique() == len(self.df):
-                score -= 10
-                issues.append(f"Potential ID column: {col}")
+        for col in self._nun.index[self._nun.to_numpy() == self._n]:
+            score -= 10
+            issues.append(f"Potential ID column: {col}")
         
-        for col in self.categorical_cols:
-            if self.df[col].nunique() > 100:
-                score -= 5
-                issues.append(f"High cardinality: {col}")
+        cat_nun = self._nun[self.categorical_cols]
+        for col in cat_nun.index[cat_nun.to_numpy() > 100]:
+            score -= 5
+            issues.append(f"High cardinality: {col}")
         
         if score >= 80:
             status = "ready"
@@ -250,53 +325,44 @@ X_train, X_test = train_test_split(X, test_size=0.2, random_state=SEED)
                 "data_quality": missing_pct < 5,
                 "no_leakage": len(issues) < 2,
                 "consistent_types": True,
-                "sufficient_samples": len(self.df) >= 100
+                "sufficient_samples": self._n >= 100
             }
         }
     
     def data_drift_risk(self) -> Dict[str, Any]:
         """Assess data drift risk per feature."""
-        risks = []
+        std = self._desc['std'].to_numpy(dtype=np.float64)
+        mean = self._desc['mean'].to_numpy(dtype=np.float64)
+        cv = std / (np.abs(mean) + 1e-10)
+        cv_rounded = np.round(cv, 2)
         
-        for col in self.numeric_cols:
-            cv = self.df[col].std() / (abs(self.df[col].mean()) + 1e-10)
-            
-            risk_level = "high" if cv > 1 else "medium" if cv > 0.5 else "low"
-            
+        risks = []
+        for i in np.argsort(-cv_rounded, kind='stable'):
+            risk_level = "high" if cv[i] > 1 else "medium" if cv[i] > 0.5 else "low"
             risks.append({
-                "feature": col,
-                "coefficient_of_variation": round(cv, 2),
+                "feature": self.numeric_cols[i],
+                "coefficient_of_variation": float(cv_rounded[i]),
                 "drift_risk": risk_level,
                 "recommendation": "Monitor closely" if risk_level == "high" else "Standard monitoring"
             })
         
         return {
-            "overall_risk": "high" if any(r["drift_risk"] == "high" for r in risks) else "medium",
-            "features": sorted(risks, key=lambda x: x["coefficient_of_variation"], reverse=True)
+            "overall_risk": "high" if (cv > 1).any() else "medium",
+            "features": risks
         }
     
     def schema_change_alerts(self) -> Dict[str, Any]:
         """Generate schema for change detection."""
         schema = {
-            "columns": list(self.df.columns),
-            "dtypes": {col: str(dtype) for col, dtype in self.df.dtypes.items()},
-            "nullable": {col: bool(self.df[col].isnull().any()) for col in self.df.columns},
-            "unique_counts": {col: int(self.df[col].nunique()) for col in self.df.columns}
+            "columns": self._cols,
+            "dtypes": self.df.dtypes.astype(str).to_dict(),
+            "nullable": (self._null > 0).to_dict(),
+            "unique_counts": self._nun.to_dict()
         }
         
         return {
             "current_schema": schema,
-            "validation_code": """
-def validate_schema(new_df, expected_schema):
-    errors = []
-    for col in expected_schema['columns']:
-        if col not in new_df.columns:
-            errors.append(f"Missing column: {col}")
-    for col in new_df.columns:
-        if col not in expected_schema['columns']:
-            errors.append(f"Unexpected column: {col}")
-    return errors
-""",
+            "validation_code": _SCHEMA_VALIDATION_CODE,
             "alert_on": ["Missing columns", "Type changes", "New columns"]
         }
     
@@ -307,38 +373,24 @@ def validate_schema(new_df, expected_schema):
         return {
             "version": version,
             "export_format": "joblib",
-            "code": f"""
-import joblib
-from datetime import datetime
-
-# Save with version
-version = "{version}"
-artifacts = {{
-    'preprocessor': preprocessor,
-    'model': model,
-    'version': version,
-    'created_at': datetime.now().isoformat(),
-    'n_features': {len(self.df.columns)},
-    'feature_names': {list(self.df.columns)}
-}}
-
-joblib.dump(artifacts, f'pipeline_v{{version}}.pkl')
-""",
+            "code": _VERSIONED_EXPORT_TEMPLATE.format(
+                version=version, n_features=self._ncols, feature_names=self._cols
+            ),
             "metadata": {
-                "n_features": len(self.df.columns),
-                "feature_names": list(self.df.columns),
-                "n_samples_trained": len(self.df)
+                "n_features": self._ncols,
+                "feature_names": self._cols,
+                "n_samples_trained": self._n
             }
         }
     
     def inference_cost_estimation(self) -> Dict[str, Any]:
         """Estimate inference costs."""
-        n_features = len(self.df.columns)
+        n_features = self._ncols
         n_numeric = len(self.numeric_cols)
         n_categorical = len(self.categorical_cols)
         
         preprocessing_complexity = n_numeric * 2 + n_categorical * 5
-        onehot_features = sum(self.df[col].nunique() for col in self.categorical_cols)
+        onehot_features = int(self._nun[self.categorical_cols].sum())
         
         return {
             "preprocessing_ops_per_sample": preprocessing_complexity,
@@ -3,26 +3,88 @@ import pandas as pd
 import math
 from typing import Any
 
+def _sanitize_float(obj: float) -> Any:
+    if math.isnan(obj) or math.isinf(obj):
+        return None
+    return float(obj)
+
+def _sanitize_array(obj: np.ndarray) -> Any:
+    kind = obj.dtype.kind
+    if kind == 'f':
+        # Mask NaN/Inf in one pass; tolist() already yields Python floats
+        return np.where(np.isfinite(obj), obj, None).tolist()
+    if kind in 'iub':
+        return obj.tolist()
+    return sanitize_for_json(obj.tolist())
+
+_PRIMITIVE_TYPES = frozenset((str, int, bool, type(None)))
+_isfinite = math.isfinite
+
+# The container sanitizers return obj itself when nothing in it needed
+# converting, so already JSON-safe subtrees are shared instead of rebuilt and
+# each value is visited once. Plain JSON scalars (finite floats included) are
+# checked inline rather than dispatched.
+
+def _sanitize_dict(obj: dict) -> dict:
+    out = None
+    for key, value in obj.items():
+        value_type = type(value)
+        if value_type in _PRIMITIVE_TYPES or (value_type is float and _isfinite(value)):
+            continue
+        new = sanitize_for_json(value)
+        if new is not value:
+            if out is None:
+                out = obj.copy()
+            out[key] = new
+    return obj if out is None else out
+
+def _sanitize_list(obj: list) -> list:
+    out = None
+    for i, item in enumerate(obj):
+        item_type = type(item)
+        if item_type in _PRIMITIVE_TYPES or (item_type is float and _isfinite(item)):
+            continue
+        new = sanitize_for_json(item)
+        if new is not item:
+            if out is None:
+                out = obj.copy()
+            out[i] = new
+    return obj if out is None else out
+
+# Exact-type lookup for the common cases; subclasses fall through to the checks below
+_DISPATCH = {
+    dict: _sanitize_dict,
+    list: _sanitize_list,
+    str: lambda obj: obj,
+    int: lambda obj: obj,
+    bool: lambda obj: obj,
+    type(None): lambda obj: obj,
+    float: lambda obj: obj if math.isfinite(obj) else None,
+    np.float64: _sanitize_float,
+    np.float32: _sanitize_float,
+    np.int64: int,
+    np.int32: int,
+    np.bool_: bool,
+    np.ndarray: _sanitize_array,
+}
+
 def sanitize_for_json(obj: Any) -> Any:
     """Convert numpy types and handle NaN/Inf values for JSON serialization."""
+    handler = _DISPATCH.get(type(obj))
+    if handler is not None:
+        return handler(obj)
     if isinstance(obj, dict):
         return {k: sanitize_for_json(v) for k, v in obj.items()}
     elif isinstance(obj, list):
         return [sanitize_for_json(item) for item in obj]
-    elif isinstance(obj, (np.integer, np.int64, np.int32)):
+    elif isinstance(obj, np.integer):
         return int(obj)
-    elif isinstance(obj, (np.floating, np.float64, np.float32)):
-        if math.isnan(obj) or math.isinf(obj):
-            return None
-        return float(obj)
+    elif isinstance(obj, (np.floating, float)):
+        return _sanitize_float(obj)
     elif isinstance(obj, np.ndarray):
-        return sanitize_for_json(obj.tolist())
+        return _sanitize_array(obj)
     elif isinstance(obj, np.bool_):
         return bool(obj)
-    elif isinstance(obj, float):
-        if math.isnan(obj) or math.isinf(obj):
-            return None
-        return obj
-    elif pd.isna(obj):
+    elif pd.api.types.is_scalar(obj) and pd.isna(obj):
         return None
     return obj
@@ -12,74 +12,147 @@ from reportlab.platypus import (
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from reportlab.lib import colors
+import numpy as np
 import io
 import base64
+from functools import lru_cache
 from datetime import datetime
 from typing import Dict, Any
 
 
+# Table styles are immutable once built, so every report shares them
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), HexColor('#8b5cf6')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('TOPPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), HexColor('#f9fafb')),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 11),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+    ('TOPPADDING', (0, 1), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, HexColor('#e5e7eb')),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+_STATS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), HexColor('#6366f1')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+    ('TOPPADDING', (0, 0), (-1, 0), 10),
+    ('BACKGROUND', (0, 1), (-1, -1), HexColor('#f9fafb')),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+    ('TOPPADDING', (0, 1), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 1, HexColor('#e5e7eb')),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+_CORR_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), HexColor('#a855f7')),
+    ('BACKGROUND', (0, 0), (0, -1), HexColor('#a855f7')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('TEXTCOLOR', (0, 0), (0, -1), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('PADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 1, HexColor('#e5e7eb')),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+_STAT_KEYS = ('mean', 'std', 'min', 'max')
+
+
+def _format_stat(value) -> str:
+    """Format one statistics cell; missing (or zero) values show as N/A."""
+    return f"{value:.2f}" if value else "N/A"
+
+
+@lru_cache(maxsize=None)
+def _build_styles():
+    """Build the custom paragraph styles once and share them across reports."""
+    styles = getSampleStyleSheet()
+    
+    # Title style
+    styles.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=styles['Title'],
+        fontSize=28,
+        textColor=HexColor('#8b5cf6'),
+        spaceAfter=30,
+        alignment=TA_CENTER,
+    ))
+    
+    # Subtitle style
+    styles.add(ParagraphStyle(
+        name='CustomSubtitle',
+        parent=styles['Normal'],
+        fontSize=12,
+        textColor=HexColor('#6b7280'),
+        spaceAfter=20,
+        alignment=TA_CENTER,
+    ))
+    
+    # Section header style
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading1'],
+        fontSize=16,
+        textColor=HexColor('#1f2937'),
+        spaceBefore=20,
+        spaceAfter=12,
+        borderPadding=10,
+    ))
+    
+    # Body text style
+    styles.add(ParagraphStyle(
+        name='BodyText',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=HexColor('#374151'),
+        spaceAfter=8,
+        leading=16,
+    ))
+    
+    # Insight style
+    styles.add(ParagraphStyle(
+        name='Insight',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=HexColor('#1f2937'),
+        leftIndent=20,
+        spaceAfter=6,
+        bulletIndent=10,
+    ))
+    
+    # Footer style
+    styles.add(ParagraphStyle(
+        name='Footer',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=HexColor('#9ca3af'),
+        alignment=TA_CENTER,
+        spaceBefore=10,
+    ))
+    return styles
+
+
 class PDFReportGenerator:
     """
     Generate professional PDF reports from analysis data.
     """
     
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._create_custom_styles()
-        
-    def _create_custom_styles(self):
-        """Create custom paragraph styles."""
-        # Title style
-        self.styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=self.styles['Title'],
-            fontSize=28,
-            textColor=HexColor('#8b5cf6'),
-            spaceAfter=30,
-            alignment=TA_CENTER,
-        ))
-        
-        # Subtitle style
-        self.styles.add(ParagraphStyle(
-            name='CustomSubtitle',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            textColor=HexColor('#6b7280'),
-            spaceAfter=20,
-            alignment=TA_CENTER,
-        ))
-        
-        # Section header style
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=self.styles['Heading1'],
-            fontSize=16,
-            textColor=HexColor('#1f2937'),
-            spaceBefore=20,
-            spaceAfter=12,
-            borderPadding=10,
-        ))
-        
-        # Body text style
-        self.styles.add(ParagraphStyle(
-            name='BodyText',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            textColor=HexColor('#374151'),
-            spaceAfter=8,
-            leading=16,
-        ))
-        
-        # Insight style
-        self.styles.add(ParagraphStyle(
-            name='Insight',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            textColor=HexColor('#1f2937'),
-            leftIndent=20,
-            spaceAfter=6,
-            bulletIndent=10,
-        ))
+        self.styles = _build_styles()
     
     def _create_header(self, report_id: str, file_name: str) -> list:
         """Create report header elements."""
@@ -120,22 +193,7 @@ class PDFReportGenerator:
         ]
         
         table = Table(summary_data, colWidths=[3*inch, 2*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), HexColor('#8b5cf6')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('TOPPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), HexColor('#f9fafb')),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 11),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-            ('TOPPADDING', (0, 1), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, HexColor('#e5e7eb')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        table.setStyle(_SUMMARY_TABLE_STYLE)
         
         elements.append(table)
         elements.append(Spacer(1, 20))
@@ -156,36 +214,14 @@ class PDFReportGenerator:
         
         # Create stats table for numeric columns
         headers = ["Column", "Mean", "Std", "Min", "Max"]
-        stats_data = [headers]
-        
-        for col in numeric_cols[:10]:  # Limit to 10 columns
-            col_stats = statistics.get(col, {})
-            row = [
-                col[:20] + "..." if len(col) > 20 else col,
-                f"{col_stats.get('mean', 'N/A'):.2f}" if col_stats.get('mean') else "N/A",
-                f"{col_stats.get('std', 'N/A'):.2f}" if col_stats.get('std') else "N/A",
-                f"{col_stats.get('min', 'N/A'):.2f}" if col_stats.get('min') else "N/A",
-                f"{col_stats.get('max', 'N/A'):.2f}" if col_stats.get('max') else "N/A",
-            ]
-            stats_data.append(row)
+        stats_data = [headers] + [
+            [col[:20] + "..." if len(col) > 20 else col]
+            + [_format_stat(statistics.get(col, {}).get(key)) for key in _STAT_KEYS]
+            for col in numeric_cols[:10]  # Limit to 10 columns
+        ]
         
         table = Table(stats_data, colWidths=[1.5*inch, 1*inch, 1*inch, 1*inch, 1*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), HexColor('#6366f1')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-            ('TOPPADDING', (0, 0), (-1, 0), 10),
-            ('BACKGROUND', (0, 1), (-1, -1), HexColor('#f9fafb')),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-            ('TOPPADDING', (0, 1), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 1, HexColor('#e5e7eb')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        table.setStyle(_STATS_TABLE_STYLE)
         
         elements.append(table)
         elements.append(Spacer(1, 20))
@@ -238,35 +274,22 @@ class PDFReportGenerator:
         
         # Header row
         headers = [""] + cols
-        corr_data = [headers]
         
-        # Data rows
-        for col1 in cols:
-            row = [col1[:10] + "..." if len(col1) > 10 else col1]
-            for col2 in cols:
-                val = correlation.get(col1, {}).get(col2, 0)
-                row.append(f"{val:.2f}")
-            corr_data.append(row)
+        # Data rows - format the whole matrix in one call
+        values = np.array(
+            [[correlation[col1].get(col2, 0) for col2 in cols] for col1 in cols],
+            dtype=np.float64,
+        )
+        formatted = np.char.mod('%.2f', values).tolist()
+        corr_data = [headers] + [
+            [col1[:10] + "..." if len(col1) > 10 else col1] + row
+            for col1, row in zip(cols, formatted)
+        ]
         
         col_width = 0.9 * inch
         table = Table(corr_data, colWidths=[1.2*inch] + [col_width] * len(cols))
         
-        # Style with conditional formatting
-        style_commands = [
-            ('BACKGROUND', (0, 0), (-1, 0), HexColor('#a855f7')),
-            ('BACKGROUND', (0, 0), (0, -1), HexColor('#a855f7')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('PADDING', (0, 0), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 1, HexColor('#e5e7eb')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]
-        
-        table.setStyle(TableStyle(style_commands))
+        table.setStyle(_CORR_TABLE_STYLE)
         elements.append(table)
         elements.append(Spacer(1, 20))
         
@@ -283,14 +306,7 @@ class PDFReportGenerator:
         ))
         elements.append(Paragraph(
             "Generated by Kuya Cloud • kuyacloud.com",
-            ParagraphStyle(
-                name='Footer',
-                parent=self.styles['Normal'],
-                fontSize=10,
-                textColor=HexColor('#9ca3af'),
-                alignment=TA_CENTER,
-                spaceBefore=10,
-            )
+            self.styles['Footer']
         ))
         
         return elements
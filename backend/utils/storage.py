@@ -3,16 +3,173 @@ Storage Utility - File storage operations
 For local development and future cloud storage integration
 """
 
+import asyncio
 import os
-import uuid
-from datetime import datetime
-from typing import Optional
-import aiofiles
-import aiofiles.os
+import secrets
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import AsyncIterable, AsyncIterator, List, Optional, Tuple
 
 # Storage settings
 STORAGE_PATH = os.getenv("STORAGE_PATH", "./uploads")
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+USAGE_CACHE_TTL = 300  # seconds before get_storage_usage re-walks the tree
+READ_CHUNK_SIZE = 64 * 1024  # bytes per chunk when streaming files
+DROP_CACHE_MIN_BYTES = 1024 * 1024  # uploads this large are evicted from the page cache
+SHARED_DIR = "_shared"  # top-level directory for files saved without a user_id
+KNOWN_DIRS_CACHE_SIZE = 4096  # created directories remembered so writes skip the makedirs
+
+# Dedicated pool for blocking file IO, so storage bursts neither queue behind
+# nor starve other work on the loop's default executor
+IO_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("STORAGE_IO_THREADS", "32")),
+    thread_name_prefix="storage-io",
+)
+
+
+async def _io(func, *args):
+    """Run a blocking storage call on IO_EXECUTOR."""
+    return await asyncio.get_running_loop().run_in_executor(IO_EXECUTOR, func, *args)
+
+
+async def _io_settled(func, *args):
+    """Like _io, but on cancellation wait for the worker call to finish before re-raising.
+
+    Cancelling the await does not stop the executor thread, so calls on an fd the
+    caller closes afterwards must settle first; otherwise the thread could read or
+    write a reused fd number.
+    """
+    task = asyncio.ensure_future(_io(func, *args))
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        while not task.done():
+            try:
+                await asyncio.wait([task])
+            except asyncio.CancelledError:
+                pass
+        raise
+
+
+def _check_size(size: int, max_bytes: int = MAX_FILE_SIZE):
+    """Reject content over the storage size limit."""
+    if size > max_bytes:
+        raise ValueError(f"File too large. Maximum {max_bytes:,} bytes supported.")
+
+
+def _make_dirs(dir_paths):
+    """Blocking makedirs of each of dir_paths; existing ones are fine."""
+    for dir_path in dir_paths:
+        os.makedirs(dir_path, exist_ok=True)
+
+
+def _open_for_write(file_path: str, new_dirs=()) -> int:
+    """Open (create/truncate) file_path for raw writes; returns the fd.
+
+    new_dirs are created first. A parent directory missing anyway (never seen,
+    or removed since) is created and the open retried once.
+    """
+    _make_dirs(new_dirs)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        return os.open(file_path, flags, 0o644)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        return os.open(file_path, flags, 0o644)
+
+
+def _write_fd(fd: int, content: bytes):
+    """Blocking write of all of content to fd (os.write may write partially)."""
+    view = memoryview(content)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _drop_page_cache(fd: int, size: int):
+    """Flush a large finished upload and hint the kernel to drop its cached pages."""
+    if size >= DROP_CACHE_MIN_BYTES and hasattr(os, "posix_fadvise"):
+        # DONTNEED only evicts clean pages, hence the flush first
+        os.fdatasync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _write_bytes(file_path: str, content: bytes, new_dirs=()):
+    """Blocking write (directories included); run through _io as one executor hop."""
+    # Hand the payload straight to the kernel; no buffered file object needed
+    fd = _open_for_write(file_path, new_dirs)
+    try:
+        _write_fd(fd, content)
+        _drop_page_cache(fd, len(content))
+    finally:
+        os.close(fd)
+
+
+def _write_many(items: List[Tuple[str, bytes]], new_dirs=()):
+    """Blocking writes of (file_path, content) pairs, all in one executor hop."""
+    _make_dirs(new_dirs)
+    for file_path, content in items:
+        _write_bytes(file_path, content)
+
+
+def _read_bytes(file_path: str) -> bytes:
+    """Blocking read; run through _io as one executor hop."""
+    with open(file_path, 'rb') as f:
+        return f.read()
+
+
+def _sendfile(file_path: str, out_fd: int) -> int:
+    """Blocking zero-copy transfer of a whole file to out_fd; returns bytes sent."""
+    in_fd = os.open(file_path, os.O_RDONLY)
+    try:
+        size = os.fstat(in_fd).st_size
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+            if not sent:
+                break
+            offset += sent
+        return offset
+    finally:
+        os.close(in_fd)
+
+
+def _scan_dir(path: str) -> Tuple[int, List[str]]:
+    """Blocking scan of one directory: (bytes in its files, its subdirectory paths)."""
+    # scandir entries carry their type and path, so each file costs one
+    # stat and no path join (os.walk + getsize paid for both)
+    size, subdirs = 0, []
+    try:
+        entries = os.scandir(path)
+    except FileNotFoundError:
+        # Not created yet (or removed mid-walk): nothing stored there
+        return size, subdirs
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                size += entry.stat(follow_symlinks=False).st_size
+    return size, subdirs
+
+
+def _tree_size(path: str) -> int:
+    """Blocking total size of the files under path (symlinks not followed)."""
+    total_size, stack = 0, [path]
+    while stack:
+        size, subdirs = _scan_dir(stack.pop())
+        total_size += size
+        stack.extend(subdirs)
+    return total_size
+
+
+def _remove_file(file_path: str) -> int:
+    """Blocking stat + remove in one executor hop; returns the removed size."""
+    size = os.stat(file_path).st_size
+    os.remove(file_path)
+    return size
 
 
 class StorageService:
@@ -21,14 +178,91 @@ class StorageService:
     Currently uses local filesystem, can be extended for cloud storage.
     """
     
+    __slots__ = ("base_path", "_usage", "_usage_ts", "_usage_gen", "_usage_pending", "_known_dirs")
+    
     def __init__(self, base_path: str = STORAGE_PATH):
         self.base_path = base_path
+        # Usage in bytes per user_id (None = whole storage) and when it was walked
+        self._usage = {}
+        self._usage_ts = {}
+        # Per-key count of finished and in-flight file changes, so a usage walk
+        # can tell whether a save/delete overlapped it
+        self._usage_gen = {}
+        self._usage_pending = {}
+        # Directories already created (LRU). Only a hint: writes skip the
+        # makedirs for them, and recreate a directory removed since
+        self._known_dirs = OrderedDict()
         self._ensure_directory()
     
     def _ensure_directory(self):
         """Ensure storage directory exists."""
-        if not os.path.exists(self.base_path):
-            os.makedirs(self.base_path)
+        os.makedirs(self.base_path, exist_ok=True)
+    
+    def _new_dirs(self, file_paths) -> list:
+        """Parent directories of file_paths not known to exist, for the write hop to create."""
+        new_dirs = []
+        for dir_path in {os.path.dirname(file_path) for file_path in file_paths}:
+            if dir_path in self._known_dirs:
+                self._known_dirs.move_to_end(dir_path)
+            else:
+                new_dirs.append(dir_path)
+        return new_dirs
+    
+    def _remember_dirs(self, dir_paths):
+        """Record dir_paths as created, evicting the least recently used beyond the cache size."""
+        for dir_path in dir_paths:
+            self._known_dirs[dir_path] = None
+        while len(self._known_dirs) > KNOWN_DIRS_CACHE_SIZE:
+            self._known_dirs.popitem(last=False)
+    
+    def _usage_keys(self, file_path: str) -> set:
+        """Usage cache keys (None = whole storage, else user_id) whose totals cover file_path."""
+        parts = os.path.relpath(file_path, self.base_path).split(os.sep)
+        if parts[0] == "..":
+            return set()
+        # Owned files sit at <user>/<name> (flat) or <user>/ab/cd/<name> (sharded);
+        # unowned ones at <name> (flat) or _shared/ab/cd/<name>
+        owner = parts[0] if len(parts) in (2, 4) and parts[0] != SHARED_DIR else None
+        return {None, owner}
+    
+    @contextmanager
+    def _usage_change(self, file_paths):
+        """Mark the usage totals covering file_paths as changing while their files are written or removed."""
+        keys = set().union(*(self._usage_keys(file_path) for file_path in file_paths))
+        for key in keys:
+            self._usage_pending[key] = self._usage_pending.get(key, 0) + 1
+        try:
+            yield
+        finally:
+            for key in keys:
+                self._usage_gen[key] = self._usage_gen.get(key, 0) + 1
+                self._usage_pending[key] -= 1
+                if not self._usage_pending[key]:
+                    del self._usage_pending[key]
+    
+    def _adjust_usage(self, file_path: str, delta: int):
+        """Apply a size change to every cached usage total that covers file_path."""
+        for key in self._usage_keys(file_path):
+            if key in self._usage:
+                self._usage[key] += delta
+    
+    def _new_file_path(self, filename: str, user_id: Optional[str] = None) -> str:
+        """Pick a unique storage path for filename (its directories are created by the write)."""
+        if user_id == SHARED_DIR:
+            raise ValueError(f"'{SHARED_DIR}' is reserved and cannot be used as a user_id.")
+        # Generate unique filename
+        ext = os.path.splitext(filename)[1]  # includes the leading '.'
+        # Nanosecond timestamp + 48 random bits; one clock read and a 6-byte urandom
+        token = secrets.token_hex(6)
+        unique_name = f"{time.time_ns():x}_{token}"
+        if ext != ".":
+            unique_name += ext
+        
+        # Shard into ab/cd/ by the random token (the time prefix barely varies),
+        # under the user subdirectory (or _shared/ without a user_id, so shard
+        # and user directories never mix), so no directory grows without bound
+        dir_path = os.path.join(self.base_path, user_id or SHARED_DIR, token[:2], token[2:4])
+        return os.path.join(dir_path, unique_name)
     
     async def save_file(self, content: bytes, filename: str, user_id: Optional[str] = None) -> str:
         """
@@ -41,26 +275,90 @@ class StorageService:
             
         Returns:
             Storage path/key for the file
+            
+        Raises:
+            ValueError: If content exceeds MAX_FILE_SIZE or user_id is reserved
         """
-        # Generate unique filename
-        ext = filename.split(".")[-1] if "." in filename else ""
-        unique_name = f"{uuid.uuid4().hex}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        if ext:
-            unique_name += f".{ext}"
-        
-        # Create user subdirectory if user_id provided
-        if user_id:
-            user_path = os.path.join(self.base_path, user_id)
-            if not os.path.exists(user_path):
-                os.makedirs(user_path)
-            file_path = os.path.join(user_path, unique_name)
-        else:
-            file_path = os.path.join(self.base_path, unique_name)
+        _check_size(len(content))
+        file_path = self._new_file_path(filename, user_id)
         
         # Save file
-        async with aiofiles.open(file_path, 'wb') as f:
-            await f.write(content)
+        new_dirs = self._new_dirs([file_path])
+        with self._usage_change([file_path]):
+            await _io(_write_bytes, file_path, content, new_dirs)
+            self._remember_dirs(new_dirs)
+            self._adjust_usage(file_path, len(content))
+        return file_path
+    
+    async def save_files(self, batch: List[Tuple[bytes, str, Optional[str]]]) -> List[str]:
+        """
+        Save several files with a single executor dispatch.
+        
+        Args:
+            batch: (content, filename, user_id) tuples, as for save_file
+            
+        Returns:
+            Storage paths/keys, in batch order
+            
+        Raises:
+            ValueError: If any content exceeds MAX_FILE_SIZE or any user_id is reserved (nothing is saved)
+        """
+        for content, _, _ in batch:
+            _check_size(len(content))
+        items = [(self._new_file_path(filename, user_id), content) for content, filename, user_id in batch]
         
+        # Save files
+        file_paths = [file_path for file_path, _ in items]
+        new_dirs = self._new_dirs(file_paths)
+        with self._usage_change(file_paths):
+            await _io(_write_many, items, new_dirs)
+            self._remember_dirs(new_dirs)
+            for file_path, content in items:
+                self._adjust_usage(file_path, len(content))
+        return file_paths
+    
+    async def save_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        filename: str,
+        user_id: Optional[str] = None,
+        max_bytes: int = MAX_FILE_SIZE,
+    ) -> str:
+        """
+        Save a file from an async stream of chunks without buffering it whole.
+        
+        Args:
+            chunks: Async iterable of content chunks
+            filename: Original filename
+            user_id: Optional user ID for organizing files
+            max_bytes: Size limit; exceeding it aborts the save
+            
+        Returns:
+            Storage path/key for the file
+            
+        Raises:
+            ValueError: If the stream exceeds max_bytes (the partial file is removed) or user_id is reserved
+        """
+        file_path = self._new_file_path(filename, user_id)
+        new_dirs = self._new_dirs([file_path])
+        with self._usage_change([file_path]):
+            fd = await _io(_open_for_write, file_path, new_dirs)
+            self._remember_dirs(new_dirs)
+            total = 0
+            try:
+                async for chunk in chunks:
+                    total += len(chunk)
+                    _check_size(total, max_bytes)
+                    await _io_settled(_write_fd, fd, chunk)
+                await _io_settled(_drop_page_cache, fd, total)
+            except BaseException:
+                # Any in-flight write has settled by now, so the fd is safe to close
+                await _io(os.close, fd)
+                await _io(os.unlink, file_path)
+                raise
+            await _io(os.close, fd)
+            
+            self._adjust_usage(file_path, total)
         return file_path
     
     async def get_file(self, file_path: str) -> Optional[bytes]:
@@ -73,11 +371,56 @@ class StorageService:
         Returns:
             File content as bytes, or None if not found
         """
-        if not os.path.exists(file_path):
+        try:
+            return await _io(_read_bytes, file_path)
+        except FileNotFoundError:
             return None
+    
+    async def iter_file(self, file_path: str, chunk_size: int = READ_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """
+        Stream a file from storage in chunks (e.g. into a StreamingResponse).
+        
+        Only one chunk is held in memory at a time, unlike get_file.
         
-        async with aiofiles.open(file_path, 'rb') as f:
-            return await f.read()
+        Args:
+            file_path: Path to the file
+            chunk_size: Maximum bytes per yielded chunk
+            
+        Yields:
+            Successive chunks of the file content
+            
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        fd = await _io(os.open, file_path, os.O_RDONLY)
+        try:
+            while True:
+                data = await _io_settled(os.read, fd, chunk_size)
+                if not data:
+                    return
+                yield data
+        finally:
+            # No read is in flight here (_io_settled waits for it on cancellation)
+            await _io(os.close, fd)
+    
+    async def send_file_to(self, file_path: str, out_fd: int) -> Optional[int]:
+        """
+        Send a file straight to a socket/file descriptor with os.sendfile.
+        
+        The kernel copies from the page cache, so the content never passes
+        through Python. out_fd must be blocking; needs os.sendfile (POSIX).
+        
+        Args:
+            file_path: Path to the file
+            out_fd: Destination file descriptor (e.g. socket.fileno())
+            
+        Returns:
+            Number of bytes sent, or None if not found
+        """
+        try:
+            return await _io(_sendfile, file_path, out_fd)
+        except FileNotFoundError:
+            return None
     
     async def delete_file(self, file_path: str) -> bool:
         """
@@ -89,10 +432,13 @@ class StorageService:
         Returns:
             True if deleted, False if not found
         """
-        if not os.path.exists(file_path):
-            return False
-        
-        await aiofiles.os.remove(file_path)
+        with self._usage_change([file_path]):
+            try:
+                size = await _io(_remove_file, file_path)
+            except FileNotFoundError:
+                return False
+            
+            self._adjust_usage(file_path, -size)
         return True
     
     async def get_file_info(self, file_path: str) -> Optional[dict]:
@@ -103,20 +449,45 @@ class StorageService:
             file_path: Path to the file
             
         Returns:
-            Dictionary with file info, or None if not found
+            Dictionary with file info (created/modified as POSIX timestamps,
+            e.g. for datetime.fromtimestamp), or None if not found
         """
-        if not os.path.exists(file_path):
+        try:
+            stat = await _io(os.stat, file_path)
+        except FileNotFoundError:
             return None
         
-        stat = os.stat(file_path)
         return {
             "path": file_path,
             "size": stat.st_size,
-            "created": datetime.fromtimestamp(stat.st_ctime),
-            "modified": datetime.fromtimestamp(stat.st_mtime),
+            "created": stat.st_ctime,
+            "modified": stat.st_mtime,
         }
     
-    def get_storage_usage(self, user_id: Optional[str] = None) -> int:
+    def _cached_usage(self, key: Optional[str]) -> Optional[int]:
+        """Cached usage total for key, or None once USAGE_CACHE_TTL has passed since its walk."""
+        # Kept current by save/delete in between walks
+        cached_at = self._usage_ts.get(key)
+        if cached_at is not None and time.monotonic() - cached_at < USAGE_CACHE_TTL:
+            return self._usage[key]
+        return None
+    
+    def _usage_mark(self, key: Optional[str]) -> Optional[int]:
+        """Change generation of key to pass to _store_usage after a walk; None if a change is in flight."""
+        if key in self._usage_pending:
+            return None
+        return self._usage_gen.get(key, 0)
+    
+    def _store_usage(self, key: Optional[str], total_size: int, mark: Optional[int]):
+        """Cache a walked total unless a save/delete overlapped the walk."""
+        # A save/delete in flight at either end of the walk, or finished during
+        # it, may or may not be in the walked total while its delta is applied
+        # to the cache anyway; only cache a walk nothing overlapped
+        if mark is not None and key not in self._usage_pending and self._usage_gen.get(key, 0) == mark:
+            self._usage[key] = total_size
+            self._usage_ts[key] = time.monotonic()
+    
+    async def get_storage_usage(self, user_id: Optional[str] = None) -> int:
         """
         Get total storage usage in bytes.
         
@@ -126,22 +497,47 @@ class StorageService:
         Returns:
             Total size in bytes
         """
-        if user_id:
-            path = os.path.join(self.base_path, user_id)
-        else:
-            path = self.base_path
+        key = user_id or None
+        cached = self._cached_usage(key)
+        if cached is not None:
+            return cached
         
-        if not os.path.exists(path):
-            return 0
+        path = os.path.join(self.base_path, user_id) if user_id else self.base_path
+        mark = self._usage_mark(key)
         
-        total_size = 0
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                file_path = os.path.join(dirpath, filename)
-                total_size += os.path.getsize(file_path)
+        # Walk each top-level subtree (users / shards) in its own executor
+        # task so their scandir/stat calls overlap
+        total_size, subdirs = await _io(_scan_dir, path)
+        subtree_sizes = await asyncio.gather(*(_io(_tree_size, d) for d in subdirs))
+        total_size += sum(subtree_sizes)
         
+        self._store_usage(key, total_size, mark)
+        return total_size
+    
+    def get_storage_usage_sync(self, user_id: Optional[str] = None) -> int:
+        """
+        Blocking get_storage_usage for callers outside the event loop.
+        
+        Shares the usage cache; on a miss the tree is walked in the calling thread.
+        
+        Args:
+            user_id: Optional user ID to check specific user's usage
+            
+        Returns:
+            Total size in bytes
+        """
+        key = user_id or None
+        cached = self._cached_usage(key)
+        if cached is not None:
+            return cached
+        
+        path = os.path.join(self.base_path, user_id) if user_id else self.base_path
+        mark = self._usage_mark(key)
+        total_size = _tree_size(path)
+        self._store_usage(key, total_size, mark)
         return total_size
 
-
-# Create default storage instance
-storage = StorageService()
+@lru_cache(maxsize=1)
+def get_storage() -> StorageService:
+    """Default storage instance, created on first use rather than at import."""
+    return StorageService()